@@ -11,8 +11,10 @@ This module provides the command-line interface with support for:
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 from pathlib import Path
+from typing import Any
 
 from . import __version__
 from .audio import (
@@ -28,12 +30,14 @@ from .collection import (
 )
 from .config import default_profile, resolve_anki_base, resolve_collection_path
 from .config_store import load_config
-from .render import render_html_to_text
-from .sync import SyncResult, run_sync
 
+# Keys accepted at the plain-mode rating prompt
+_RATING_CHOICES = frozenset("1234")
 
+
+@functools.cache
 def _check_tui_available() -> bool:
-    """Check if TUI dependencies are available."""
+    """Check if TUI dependencies are available (probed once per process)."""
     try:
         import textual  # noqa: F401
 
@@ -42,8 +46,60 @@ def _check_tui_available() -> bool:
         return False
 
 
+def _print_deck_tree(root: Any, query: str | None = None) -> None:
+    """Print the deck tree with due counts, optionally filtered by name.
+
+    Without a query, decks with nothing due are omitted (except the root).
+    With a query, a deck is printed if its name matches or a descendant
+    matches; all children of a matching deck are printed unfiltered.
+
+    Uses explicit stacks rather than recursion so large deck hierarchies
+    are walked once instead of re-scanning subtrees for every ancestor.
+    """
+    # Pre-compute which subtrees contain a match (children follow their
+    # parent in pre-order, so a reverse pass sees children first).
+    subtree_matches: dict[int, bool] = {}
+    if query:
+        q = query.lower()
+        order: list[Any] = []
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            order.append(node)
+            pending.extend(node.children)
+        for node in reversed(order):
+            subtree_matches[node.deck_id] = q in node.name.lower() or any(
+                subtree_matches[child.deck_id] for child in node.children
+            )
+
+    stack: list[tuple[Any, int, bool]] = [(root, 0, bool(query))]
+    while stack:
+        node, indent, filtered = stack.pop()
+        line = (
+            f"{'  ' * indent}{node.name}  "
+            f"({node.new_count}/{node.learn_count}/{node.review_count})"
+        )
+        children = list(node.children)
+        if filtered:
+            # Print this node only if it is a match or an ancestor of a match
+            if not subtree_matches[node.deck_id]:
+                continue
+            print(line)
+            # If this node matches, print all children normally
+            name_matches = q in node.name.lower()
+            stack.extend((child, indent + 1, not name_matches) for child in reversed(children))
+        else:
+            total = node.new_count + node.learn_count + node.review_count
+            if total > 0 or indent == 0:
+                print(line)
+            stack.extend((child, indent + 1, False) for child in reversed(children))
+
+
 def _cmd_sync(args: argparse.Namespace) -> int:
     """Handle sync command."""
+    # Deferred: clanki.sync pulls in the Anki protobuf modules at import time
+    from .sync import SyncResult, run_sync
+
     try:
         anki_base = resolve_anki_base()
         profile = default_profile(anki_base)
@@ -54,13 +110,13 @@ def _cmd_sync(args: argparse.Namespace) -> int:
 
         collection_path = resolve_collection_path(anki_base, profile)
 
-        print(f"Syncing profile: {profile}")
+        print(f"Syncing profile: {profile}", flush=True)
 
         outcome = run_sync(
             collection_path=collection_path,
             anki_base=anki_base,
             profile=profile,
-            log=lambda msg: print(f"  {msg}"),
+            log=lambda msg: print(f"  {msg}", flush=True),
         )
 
         if outcome.result == SyncResult.SUCCESS:
@@ -141,6 +197,9 @@ def _resolve_audio_autoplay(args: argparse.Namespace) -> bool:
 
 def _cmd_review(args: argparse.Namespace) -> int:
     """Handle review command."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .render import render_html_to_text
     from .review import DeckNotFoundError, Rating, ReviewSession
 
     deck_name = args.deck
@@ -190,8 +249,10 @@ def _cmd_review(args: argparse.Namespace) -> int:
 
         collection_path = resolve_collection_path(anki_base, profile)
 
-        print(f"Opening collection for profile: {profile}")
+        print(f"Opening collection for profile: {profile}", flush=True)
         col = open_collection(collection_path)
+        # Renders the answer in the background while the user reads the question
+        prefetch = ThreadPoolExecutor(max_workers=1)
 
         try:
             session = ReviewSession(col, deck_name)
@@ -209,7 +270,7 @@ def _cmd_review(args: argparse.Namespace) -> int:
                 print("No cards due for review.")
                 return 0
 
-            # Get media directory for rendering
+            # Resolve the media directory once; the renderer and audio both take a Path
             media_dir = col.media.dir()
             media_dir_path = Path(media_dir) if media_dir else None
 
@@ -235,13 +296,17 @@ def _cmd_review(args: argparse.Namespace) -> int:
                 answer_revealed = False
 
                 # Show question
-                question = render_html_to_text(card.question_html, media_dir=media_dir)
+                question = render_html_to_text(card.question_html, media_dir=media_dir_path)
                 # Substitute audio placeholders with icons for display
                 question_display = substitute_audio_icons(question)
                 print("-" * 40)
                 print(f"Card {reviewed + 1}")
                 print("-" * 40)
-                print(f"\nQuestion:\n{question_display}\n")
+                # Flush before autoplay so the card is visible while audio starts
+                print(f"\nQuestion:\n{question_display}\n", flush=True)
+                answer_future = prefetch.submit(
+                    render_html_to_text, card.answer_html, media_dir=media_dir_path
+                )
 
                 # Auto-play question audio
                 if audio_autoplay:
@@ -269,9 +334,9 @@ def _cmd_review(args: argparse.Namespace) -> int:
                         answer_revealed = True
 
                 # Show answer
-                answer = render_html_to_text(card.answer_html, media_dir=media_dir)
+                answer = answer_future.result()
                 answer_display = substitute_audio_icons(answer)
-                print(f"\nAnswer:\n{answer_display}\n")
+                print(f"\nAnswer:\n{answer_display}\n", flush=True)
 
                 # Auto-play answer audio
                 if audio_autoplay:
@@ -314,8 +379,12 @@ def _cmd_review(args: argparse.Namespace) -> int:
                             card = session.undo()
                             print("Undone. Showing previous card.")
                             # Re-display the card
-                            question = render_html_to_text(card.question_html, media_dir=media_dir)
-                            answer = render_html_to_text(card.answer_html, media_dir=media_dir)
+                            question = render_html_to_text(
+                                card.question_html, media_dir=media_dir_path
+                            )
+                            answer = render_html_to_text(
+                                card.answer_html, media_dir=media_dir_path
+                            )
                             question_display = substitute_audio_icons(question)
                             answer_display = substitute_audio_icons(answer)
                             print(f"\nQuestion:\n{question_display}\n")
@@ -339,14 +408,9 @@ def _cmd_review(args: argparse.Namespace) -> int:
                             print(f"Cannot undo: {exc}")
                             continue
 
-                    if choice in {"1", "2", "3", "4"}:
-                        rating_map = {
-                            "1": Rating.AGAIN,
-                            "2": Rating.HARD,
-                            "3": Rating.GOOD,
-                            "4": Rating.EASY,
-                        }
-                        session.answer(rating_map[choice])
+                    if choice in _RATING_CHOICES:
+                        # Rating values match the keys the user types (1-4)
+                        session.answer(Rating(int(choice)))
                         reviewed += 1
                         break
 
@@ -365,6 +429,7 @@ def _cmd_review(args: argparse.Namespace) -> int:
             )
 
         finally:
+            prefetch.shutdown(cancel_futures=True)
             close_collection(col)
 
         return 0
@@ -433,7 +498,7 @@ def _cmd_default(args: argparse.Namespace) -> int:
 
             collection_path = resolve_collection_path(anki_base, profile)
 
-            print(f"Opening collection for profile: {profile}")
+            print(f"Opening collection for profile: {profile}", flush=True)
             col = open_collection(collection_path)
 
             try:
@@ -447,50 +512,7 @@ def _cmd_default(args: argparse.Namespace) -> int:
                 # Get deck tree for counts
                 tree = col.sched.deck_due_tree()
 
-                def filter_node(node: object, query: str) -> bool:
-                    """Check if node or any descendant matches the filter."""
-                    q = query.lower()
-                    if q in node.name.lower():  # type: ignore
-                        return True
-                    for child in node.children:  # type: ignore
-                        if filter_node(child, query):
-                            return True
-                    return False
-
-                def print_deck(node: object, indent: int = 0, query: str | None = None) -> None:
-                    prefix = "  " * indent
-                    total = node.new_count + node.learn_count + node.review_count  # type: ignore
-                    if query:
-                        q = query.lower()
-                        name_matches = q in node.name.lower()  # type: ignore
-                        has_matching_child = any(
-                            filter_node(c, query) for c in node.children  # type: ignore
-                        )
-                        if not name_matches and not has_matching_child:
-                            return
-                        # Print this node (it's either a match or ancestor of a match)
-                        print(
-                            f"{prefix}{node.name}  "  # type: ignore
-                            f"({node.new_count}/{node.learn_count}/{node.review_count})"  # type: ignore
-                        )
-                        # If this node matches, print all children normally
-                        if name_matches:
-                            for child in node.children:  # type: ignore
-                                print_deck(child, indent + 1)
-                        else:
-                            # Only recurse into matching children
-                            for child in node.children:  # type: ignore
-                                print_deck(child, indent + 1, query)
-                    else:
-                        if total > 0 or indent == 0:
-                            print(
-                                f"{prefix}{node.name}  "  # type: ignore
-                                f"({node.new_count}/{node.learn_count}/{node.review_count})"  # type: ignore
-                            )
-                        for child in node.children:  # type: ignore
-                            print_deck(child, indent + 1)
-
-                print_deck(tree, query=deck_filter)
+                _print_deck_tree(tree, deck_filter)
 
                 print()
                 print("Run 'clanki review \"Deck Name\"' to start reviewing.")
@@ -67,6 +67,25 @@ def resolve_anki_base(override: str | Path | None = None) -> Path:
 _EXCLUDED_FOLDERS = {"addons21", "logs", "crash.log", "prefs21.db"}
 
 
+def _scan_profiles(base: Path) -> dict[str, float]:
+    """Map profile names to the mtime of their collection.anki2.
+
+    Uses a single os.scandir pass, so directory entries come with their file
+    type and each profile costs one stat (which also yields the mtime).
+    """
+    profiles: dict[str, float] = {}
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if entry.name in _EXCLUDED_FOLDERS or not entry.is_dir():
+                continue
+            try:
+                stat = os.stat(os.path.join(entry.path, "collection.anki2"))
+            except OSError:
+                continue
+            profiles[entry.name] = stat.st_mtime
+    return profiles
+
+
 def list_profiles(anki_base: Path | None = None) -> list[str]:
     """List all available Anki profiles.
 
@@ -80,15 +99,7 @@ def list_profiles(anki_base: Path | None = None) -> list[str]:
         List of profile names (directory names containing collection.anki2).
     """
     base = resolve_anki_base(anki_base)
-    profiles = []
-
-    for entry in base.iterdir():
-        if entry.is_dir() and entry.name not in _EXCLUDED_FOLDERS:
-            collection_path = entry / "collection.anki2"
-            if collection_path.exists():
-                profiles.append(entry.name)
-
-    return sorted(profiles)
+    return sorted(_scan_profiles(base))
 
 
 def default_profile(anki_base: Path | None = None) -> str | None:
@@ -104,27 +115,23 @@ def default_profile(anki_base: Path | None = None) -> str | None:
         Name of the most recently used profile, or None if no profiles exist.
     """
     base = resolve_anki_base(anki_base)
-    profiles = list_profiles(base)
+    profiles = _scan_profiles(base)
 
     if not profiles:
         return None
 
     if len(profiles) == 1:
-        return profiles[0]
+        return next(iter(profiles))
 
     # Find most recently modified collection.anki2
     most_recent = None
     most_recent_mtime = 0.0
 
-    for profile in profiles:
-        collection_path = base / profile / "collection.anki2"
-        try:
-            mtime = collection_path.stat().st_mtime
-            if mtime > most_recent_mtime:
-                most_recent_mtime = mtime
-                most_recent = profile
-        except OSError:
-            continue
+    for profile in sorted(profiles):
+        mtime = profiles[profile]
+        if mtime > most_recent_mtime:
+            most_recent_mtime = mtime
+            most_recent = profile
 
     return most_recent
 
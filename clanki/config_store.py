@@ -9,7 +9,7 @@ from __future__ import annotations
 import json
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -50,7 +50,8 @@ class Config:
     audio_enabled: bool = True
     audio_autoplay: bool = True
     high_contrast: bool = False
-    expanded_decks: set[int] = field(default_factory=set)
+    # Immutable so the cached config can be shared without defensive copies
+    expanded_decks: frozenset[int] = frozenset()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for serialization."""
@@ -59,7 +60,7 @@ class Config:
             "audio_enabled": self.audio_enabled,
             "audio_autoplay": self.audio_autoplay,
             "high_contrast": self.high_contrast,
-            "expanded_decks": list(self.expanded_decks),
+            "expanded_decks": sorted(self.expanded_decks),
         }
 
     @classmethod
@@ -71,7 +72,7 @@ class Config:
             audio_enabled=data.get("audio_enabled", True),
             audio_autoplay=data.get("audio_autoplay", True),
             high_contrast=data.get("high_contrast", False),
-            expanded_decks=set(expanded) if isinstance(expanded, list) else set(),
+            expanded_decks=frozenset(expanded) if isinstance(expanded, list) else frozenset(),
         )
 
 
@@ -97,8 +98,7 @@ def load_config() -> Config:
         return _cached_config
 
     try:
-        with open(config_path) as f:
-            data = json.load(f)
+        data = json.loads(config_path.read_text())
         if not isinstance(data, dict):
             raise TypeError("Config data must be a dictionary")
         _cached_config = Config.from_dict(data)
@@ -126,8 +126,8 @@ def save_config(config: Config) -> bool:
         # Create config directory if needed
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(config_path, "w") as f:
-            json.dump(config.to_dict(), f, indent=2)
+        # Encode up front and write once; json.dump issues a write per token
+        config_path.write_text(json.dumps(config.to_dict(), indent=2))
 
         _cached_config = config
         return True
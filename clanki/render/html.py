@@ -12,7 +12,11 @@ with support for:
 
 from __future__ import annotations
 
+import functools
+import io
+import os
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from html import unescape as _html_unescape
@@ -32,6 +36,9 @@ def _safe_unescape(text: str, max_depth: int = 5) -> str:
     *max_depth* iterations are reached.
     """
     for _ in range(max_depth):
+        # Nothing left to decode; also spares the final no-change comparison
+        if "&" not in text:
+            break
         unescaped = _html_unescape(text)
         if unescaped == text:
             break
@@ -58,10 +65,20 @@ RAW_CLOZE_PATTERN = re.compile(
     re.DOTALL,  # Allow . to match newlines
 )
 
+# Opening marker of raw cloze syntax, used for cheap detection
+_RAW_CLOZE_OPEN_PATTERN = re.compile(r"\{\{c\d+::")
+
+
+# HTML tags inside a cloze hint (stripped for question display)
+_HINT_TAG_PATTERN = re.compile(r"<[^>]+>")
 
+
+@functools.lru_cache(maxsize=512)
 def is_cloze_card(html: str) -> bool:
     """Check if HTML contains cloze deletion markers.
 
+    Memoized: the same card side is checked again on every flip and undo.
+
     Args:
         html: HTML content from Anki card rendering.
 
@@ -70,7 +87,15 @@ def is_cloze_card(html: str) -> bool:
     """
     if not html:
         return False
-    return bool(CLOZE_PATTERN.search(html)) or bool(RAW_CLOZE_PATTERN.search(html))
+    # Each check needs a literal marker; skip its regex scan when that's absent
+    if "cloze" in html.lower() and CLOZE_PATTERN.search(html):
+        return True
+    if "{{c" not in html:
+        return False
+    # Same result as RAW_CLOZE_PATTERN.search, without its lazy groups
+    # backtracking over the rest of the card: an opener followed by any "}}"
+    opener = _RAW_CLOZE_OPEN_PATTERN.search(html)
+    return opener is not None and html.find("}}", opener.end()) != -1
 
 
 def _process_raw_cloze_in_html(html: str, mode: RenderMode) -> str:
@@ -95,7 +120,7 @@ def _process_raw_cloze_in_html(html: str, mode: RenderMode) -> str:
         if mode == RenderMode.QUESTION:
             # In question mode, show hint if available, otherwise [...]
             # Strip HTML from hint for cleaner display
-            hint_text = re.sub(r"<[^>]+>", "", hint) if hint else None
+            hint_text = _HINT_TAG_PATTERN.sub("", hint) if hint else None
             if hint_text:
                 return f"[{hint_text}]"
             return "[...]"
@@ -259,28 +284,70 @@ _VOID_ELEMENTS = frozenset(
     }
 )
 
+# Path separators for media src basenames (os.altsep is "/" on Windows only)
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
+
+# CSS parsing patterns for <style> blocks
+_CSS_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_RULE_PATTERN = re.compile(r"([^{}]+)\{([^}]*)\}", re.DOTALL)
+_CSS_CLASS_SELECTOR_PATTERN = re.compile(r"^\.([a-zA-Z_][\w-]*)$")
+_CSS_ID_SELECTOR_PATTERN = re.compile(r"^#([a-zA-Z_][\w-]*)$")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_style_declarations(style_str: str) -> dict[str, str]:
+    """Parse a ``key: value; ...`` declaration list into a dict.
+
+    Cached because cards repeat the same inline style on many elements.
+    """
+    styles: dict[str, str] = {}
+    for part in style_str.split(";"):
+        key, sep, value = part.partition(":")
+        if sep:
+            styles[key.strip().lower()] = value.strip()
+    return styles
+
 
 class _HTMLToTextRenderer(HTMLParser):
     """HTMLParser-based renderer for terminal output."""
 
     # Block-level tags that should produce newlines
-    BLOCK_TAGS = {"br", "p", "div", "tr", "hr", "h1", "h2", "h3", "h4", "h5", "h6"}
+    BLOCK_TAGS = frozenset({"br", "p", "div", "tr", "hr", "h1", "h2", "h3", "h4", "h5", "h6"})
+
+    # Block tags that also produce a newline when closed
+    BLOCK_END_TAGS = frozenset({"tr", "h1", "h2", "h3", "h4", "h5", "h6"})
+
+    # Container tags: newline around content plus inline style support
+    CONTAINER_TAGS = frozenset({"div", "p"})
+
+    # List container tags (items are <li>)
+    LIST_TAGS = frozenset({"ul", "ol"})
 
     # Tags whose content should be skipped entirely
-    SKIP_TAGS = {"script", "button"}
+    SKIP_TAGS = frozenset({"script", "button"})
 
     # Void elements (self-closing) that should be ignored
     # These don't have closing tags, so we just skip them without tracking depth
-    VOID_SKIP_TAGS = {"input"}
+    VOID_SKIP_TAGS = frozenset({"input"})
 
     # Tags that can have hidden attribute and should skip content when hidden
-    HIDEABLE_TAGS = {"div", "span", "p"}
+    HIDEABLE_TAGS = frozenset({"div", "span", "p"})
 
     # Tags that apply text styling
-    BOLD_TAGS = {"b", "strong"}
-    ITALIC_TAGS = {"i", "em"}
-    UNDERLINE_TAGS = {"u", "ins"}
-    STRIKETHROUGH_TAGS = {"s", "del", "strike"}
+    BOLD_TAGS = frozenset({"b", "strong"})
+    ITALIC_TAGS = frozenset({"i", "em"})
+    UNDERLINE_TAGS = frozenset({"u", "ins"})
+    STRIKETHROUGH_TAGS = frozenset({"s", "del", "strike"})
+
+    # Inline style tags mapped to the TextStyle flag they set, so start and
+    # end tags dispatch with one dict lookup instead of a chain of checks
+    STYLE_TAG_FLAGS = {
+        **dict.fromkeys(BOLD_TAGS, "bold"),
+        **dict.fromkeys(ITALIC_TAGS, "italic"),
+        **dict.fromkeys(UNDERLINE_TAGS, "underline"),
+        **dict.fromkeys(STRIKETHROUGH_TAGS, "strikethrough"),
+    }
 
     def __init__(
         self,
@@ -289,7 +356,7 @@ class _HTMLToTextRenderer(HTMLParser):
         styled: bool = False,
     ) -> None:
         super().__init__()
-        self._chunks: list[str] = []
+        self._buf = io.StringIO()
         self._skip_depth = 0
         self._hidden_depth = 0  # Track nested hidden elements
         self._list_depth = 0
@@ -299,9 +366,9 @@ class _HTMLToTextRenderer(HTMLParser):
         self._styled = styled
         # Ruby/furigana state tracking
         self._in_ruby = False
-        self._ruby_base = ""
+        self._ruby_base: list[str] = []
         self._in_rt = False
-        self._rt_text = ""
+        self._rt_text: list[str] = []
         # Cloze state tracking
         self._in_cloze = False
         self._cloze_content = ""
@@ -335,11 +402,11 @@ class _HTMLToTextRenderer(HTMLParser):
             return
         if self._styled:
             self._segments.append(StyledSegment(text=text, style=self._current_style().copy()))
-        self._chunks.append(text)
+        self._buf.write(text)
 
     def _is_cloze_span(self, tag: str, attrs: list[tuple[str, str | None]]) -> bool:
         """Check if this is a cloze deletion span."""
-        if tag != "span":
+        if tag != "span" or not attrs:
             return False
         attrs_dict = dict(attrs)
         class_attr = attrs_dict.get("class", "") or ""
@@ -354,6 +421,8 @@ class _HTMLToTextRenderer(HTMLParser):
 
     def _is_display_none(self, attrs: list[tuple[str, str | None]]) -> bool:
         """Check if an element has display:none via CSS class or inline style."""
+        if not attrs:
+            return False
         attrs_dict = dict(attrs)
         # Check inline style
         style_str = attrs_dict.get("style", "") or ""
@@ -376,15 +445,10 @@ class _HTMLToTextRenderer(HTMLParser):
         return False
 
     def _parse_inline_style(self, style_str: str) -> dict[str, str]:
-        """Parse inline CSS style attribute into a dict."""
-        styles: dict[str, str] = {}
+        """Parse inline CSS style attribute into a dict (callers must not mutate it)."""
         if not style_str:
-            return styles
-        for part in style_str.split(";"):
-            if ":" in part:
-                key, value = part.split(":", 1)
-                styles[key.strip().lower()] = value.strip()
-        return styles
+            return {}
+        return _parse_style_declarations(style_str)
 
     @staticmethod
     def _parse_css_classes(css_text: str) -> dict[str, dict[str, str]]:
@@ -397,10 +461,9 @@ class _HTMLToTextRenderer(HTMLParser):
         """
         result: dict[str, dict[str, str]] = {}
         # Strip CSS comments before parsing to avoid them polluting selectors
-        css_text = re.sub(r"/\*.*?\*/", "", css_text, flags=re.DOTALL)
+        css_text = _CSS_COMMENT_PATTERN.sub("", css_text)
         # Match selector(s) followed by { properties }
-        rule_pattern = re.compile(r"([^{}]+)\{([^}]*)\}", re.DOTALL)
-        for match in rule_pattern.finditer(css_text):
+        for match in _CSS_RULE_PATTERN.finditer(css_text):
             selector_text = match.group(1).strip()
             props_str = match.group(2)
 
@@ -425,8 +488,8 @@ class _HTMLToTextRenderer(HTMLParser):
                 if " " in selector:
                     continue
                 # Match .classname or #id (simple selectors only)
-                class_match = re.match(r"^\.([a-zA-Z_][\w-]*)$", selector)
-                id_match = re.match(r"^#([a-zA-Z_][\w-]*)$", selector)
+                class_match = _CSS_CLASS_SELECTOR_PATTERN.match(selector)
+                id_match = _CSS_ID_SELECTOR_PATTERN.match(selector)
                 name = None
                 if class_match:
                     name = class_match.group(1)
@@ -498,6 +561,10 @@ class _HTMLToTextRenderer(HTMLParser):
         Class-based styles are applied first, then inline styles override
         (matching CSS specificity rules).
         """
+        # Bare <div>/<p>/<span> tags are the common case and carry no styles
+        if not attrs:
+            return {}
+
         # Start with class-based styles
         changes = self._get_class_styles(attrs)
 
@@ -553,20 +620,9 @@ class _HTMLToTextRenderer(HTMLParser):
             return
 
         # Style tag handling
-        if tag in self.BOLD_TAGS:
-            self._push_style(bold=True)
-            return
-
-        if tag in self.ITALIC_TAGS:
-            self._push_style(italic=True)
-            return
-
-        if tag in self.UNDERLINE_TAGS:
-            self._push_style(underline=True)
-            return
-
-        if tag in self.STRIKETHROUGH_TAGS:
-            self._push_style(strikethrough=True)
+        flag = self.STYLE_TAG_FLAGS.get(tag)
+        if flag is not None:
+            self._push_style(**{flag: True})
             return
 
         # Span with inline styles
@@ -579,7 +635,7 @@ class _HTMLToTextRenderer(HTMLParser):
             return
 
         # List handling
-        if tag in {"ul", "ol"}:
+        if tag in self.LIST_TAGS:
             self._list_depth += 1
             return
 
@@ -593,8 +649,8 @@ class _HTMLToTextRenderer(HTMLParser):
         # Ruby/furigana handling
         if tag == "ruby":
             self._in_ruby = True
-            self._ruby_base = ""
-            self._rt_text = ""
+            self._ruby_base = []
+            self._rt_text = []
             return
 
         if tag == "rt":
@@ -621,7 +677,7 @@ class _HTMLToTextRenderer(HTMLParser):
             return
 
         # div and p: block newline + style support (CSS classes / inline styles)
-        if tag in ("div", "p"):
+        if tag in self.CONTAINER_TAGS:
             # Check for display:none from CSS classes or inline styles
             if self._is_display_none(attrs):
                 self._hidden_depth += 1
@@ -685,25 +741,8 @@ class _HTMLToTextRenderer(HTMLParser):
                 self._pop_style()
             return
 
-        # Style tag end handling
-        if tag in self.BOLD_TAGS:
-            self._pop_style()
-            return
-
-        if tag in self.ITALIC_TAGS:
-            self._pop_style()
-            return
-
-        if tag in self.UNDERLINE_TAGS:
-            self._pop_style()
-            return
-
-        if tag in self.STRIKETHROUGH_TAGS:
-            self._pop_style()
-            return
-
-        # Span end (for inline styles)
-        if tag == "span":
+        # Style tag and span (inline styles) end handling
+        if tag in self.STYLE_TAG_FLAGS or tag == "span":
             self._pop_style()
             return
 
@@ -714,17 +753,19 @@ class _HTMLToTextRenderer(HTMLParser):
 
         if tag == "ruby":
             # Output combined format: base(reading)
-            if self._ruby_base and self._rt_text:
-                self._append_styled(f"{self._ruby_base}({self._rt_text})")
-            elif self._ruby_base:
-                self._append_styled(self._ruby_base)
+            base = "".join(self._ruby_base)
+            reading = "".join(self._rt_text)
+            if base and reading:
+                self._append_styled(f"{base}({reading})")
+            elif base:
+                self._append_styled(base)
             self._in_ruby = False
-            self._ruby_base = ""
-            self._rt_text = ""
+            self._ruby_base = []
+            self._rt_text = []
             return
 
         # List handling
-        if tag in {"ul", "ol"}:
+        if tag in self.LIST_TAGS:
             if self._list_depth > 0:
                 self._list_depth -= 1
             return
@@ -735,13 +776,13 @@ class _HTMLToTextRenderer(HTMLParser):
             return
 
         # div and p: trailing newline + pop style
-        if tag in ("div", "p"):
+        if tag in self.CONTAINER_TAGS:
             self._append_styled("\n")
             self._pop_style()
             return
 
         # Other block tags produce trailing newlines
-        if tag in {"tr", "h1", "h2", "h3", "h4", "h5", "h6"}:
+        if tag in self.BLOCK_END_TAGS:
             self._append_styled("\n")
 
     def handle_data(self, data: str) -> None:
@@ -764,11 +805,11 @@ class _HTMLToTextRenderer(HTMLParser):
 
         # Handle ruby/furigana text accumulation
         if self._in_rt:
-            self._rt_text += data
+            self._rt_text.append(data)
             return
 
         if self._in_ruby:
-            self._ruby_base += data
+            self._ruby_base.append(data)
             return
 
         self._append_styled(data)
@@ -777,19 +818,40 @@ class _HTMLToTextRenderer(HTMLParser):
         """Extract filename from a src attribute."""
         # URL-decode the path
         decoded = unquote(src)
-        # Get basename
-        filename = Path(decoded).name
-        return filename
+        # Basename via string ops on the platform's separators (no PurePath
+        # construction per image); Path collapses "." components, so defer to
+        # it for that rare case
+        name = decoded.rstrip(_PATH_SEPARATORS)
+        for sep in _PATH_SEPARATORS:
+            name = name.rpartition(sep)[2]
+        if name == ".":
+            return Path(decoded).name
+        return name
 
     def get_text(self) -> str:
         """Get the rendered text output."""
-        return "".join(self._chunks)
+        return self._buf.getvalue()
 
     def get_segments(self) -> list[StyledSegment]:
         """Get the styled segments (for styled output mode)."""
         return self._segments
 
 
+# Anki media tag formats rewritten to [audio: ...] placeholders, matched in
+# one pass: group 1 is an [anki:play:a:N] index, group 2 a [sound:...] file
+_MEDIA_TAG_PATTERN = re.compile(r"\[(?:anki:play:[aq]:(\d+)|sound:([^\]]+))\]")
+
+# Whitespace cleanup patterns for styled segments
+_MULTI_SPACE_PATTERN = re.compile(r" +")
+_MULTI_NEWLINE_PATTERN = re.compile(r"\n{3,}")
+_BLANK_LINE_PATTERN = re.compile(r"\n[ \t]+\n")
+
+
+def _media_tag_to_audio(match: re.Match[str]) -> str:
+    """Format a matched media tag as an [audio: ...] placeholder."""
+    return f"[audio: {match.group(1) or match.group(2)}]"
+
+
 def _process_media_tags(text: str) -> str:
     """Process Anki media tags in text.
 
@@ -797,21 +859,10 @@ def _process_media_tags(text: str) -> str:
     - [anki:play:a:N] -> [audio: N]
     - [sound:filename] -> [audio: filename]
     """
-    # Handle [anki:play:a:N] format
-    text = re.sub(
-        r"\[anki:play:[aq]:(\d+)\]",
-        r"[audio: \1]",
-        text,
-    )
-
-    # Handle [sound:filename] format
-    text = re.sub(
-        r"\[sound:([^\]]+)\]",
-        r"[audio: \1]",
-        text,
-    )
-
-    return text
+    # Most segments carry no media tags at all
+    if "[" not in text:
+        return text
+    return _MEDIA_TAG_PATTERN.sub(_media_tag_to_audio, text)
 
 
 def _is_anki_tag_line(line: str) -> bool:
@@ -853,45 +904,40 @@ def _normalize_whitespace(text: str) -> str:
     - Strips trailing whitespace from lines
     - Filters out Anki tag lines
     """
-    # Split into lines
-    lines = text.splitlines()
-
-    # Process each line, preserving leading indentation
     cleaned: list[str] = []
-    for line in lines:
-        # Capture leading whitespace (for list indentation)
-        match = re.match(r"^(\s*)", line)
-        leading = match.group(1) if match else ""
-        # Only preserve leading spaces that look like indentation (multiples of 2)
-        # This avoids preserving random whitespace from HTML
-        if leading and leading.replace(" ", "") == "":
-            # Keep indentation that's a multiple of 2 spaces
-            indent_level = len(leading) // 2
-            leading = "  " * indent_level
-        else:
-            leading = ""
+    append = cleaned.append
+    for line in text.splitlines():
         # Collapse internal whitespace
         content = " ".join(line.split())
-        if content:
-            # Skip lines that are just Anki tags
-            if _is_anki_tag_line(content):
+        if not content:
+            if cleaned and cleaned[-1] != "":
+                # Preserve one empty line for paragraph breaks
+                append("")
+            continue
+        # Skip lines that are just Anki tags
+        if "::" in content and _is_anki_tag_line(content):
+            continue
+        # Only preserve leading spaces that look like indentation (multiples of 2).
+        # Leading whitespace containing tabs etc. is random HTML whitespace.
+        if line[0] == " ":
+            indent = len(line) - len(line.lstrip(" "))
+            if not line[indent].isspace():
+                append("  " * (indent // 2) + content)
                 continue
-            cleaned.append(leading + content)
-        elif cleaned and cleaned[-1] != "":
-            # Preserve one empty line for paragraph breaks
-            cleaned.append("")
+        append(content)
 
-    # Remove trailing empty lines
-    while cleaned and cleaned[-1] == "":
+    # Remove trailing empty line (at most one can remain after the loop)
+    if cleaned and cleaned[-1] == "":
         cleaned.pop()
 
-    # Remove leading empty lines
-    while cleaned and cleaned[0] == "":
-        cleaned.pop(0)
-
     return "\n".join(cleaned)
 
 
+def _media_dir_key(media_dir: str | Path | None) -> Path | None:
+    """Normalize a media_dir argument into a render cache key."""
+    return Path(media_dir) if media_dir else None
+
+
 def render_html_to_text(
     html: str,
     media_dir: str | Path | None = None,
@@ -918,6 +964,24 @@ def render_html_to_text(
     if not html:
         return ""
 
+    # Fast path: plain-text fields (no tags, no raw cloze syntax) have
+    # nothing for the HTML parser to do beyond entity decoding. The output
+    # is identical to the full pipeline; this only skips the parser.
+    if "<" not in html and "{{" not in html:
+        return _normalize_whitespace(_process_media_tags(_safe_unescape(html)))
+
+    # Cards are re-rendered on undo and notes often share identical fields,
+    # so the result is memoized on the full input.
+    return _render_html_to_text_cached(html, _media_dir_key(media_dir), mode)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_html_to_text_cached(
+    html: str,
+    media_dir: Path | None,
+    mode: RenderMode,
+) -> str:
+    """Uncached body of render_html_to_text (hashable arguments only)."""
     # Strip duplicated FrontSide content from answer HTML
     if mode == RenderMode.ANSWER:
         html = _strip_front_side_from_answer(html)
@@ -933,6 +997,7 @@ def render_html_to_text(
     # Parse HTML and extract text
     renderer = _HTMLToTextRenderer(media_dir=media_dir, mode=mode, styled=False)
     renderer.feed(html)
+    renderer.close()
     text = renderer.get_text()
 
     # Decode HTML entities
@@ -961,15 +1026,13 @@ def _needs_space_between(prev_text: str, next_text: str) -> bool:
     return prev_char.isalnum() and next_char.isalnum()
 
 
-def _normalize_segments(segments: list[StyledSegment]) -> list[StyledSegment]:
+def _normalize_segments(segments: Iterable[StyledSegment]) -> list[StyledSegment]:
     """Normalize whitespace in styled segments while preserving styles.
 
     Intelligently adds spaces between styled segments when words would
     otherwise run together (e.g., "<b>bold</b>next" becomes "bold next").
+    Accepts any iterable so upstream passes can stream segments in.
     """
-    if not segments:
-        return []
-
     result: list[StyledSegment] = []
 
     for seg in segments:
@@ -1028,11 +1091,11 @@ def _normalize_segments(segments: list[StyledSegment]) -> list[StyledSegment]:
     final: list[StyledSegment] = []
     for seg in result:
         # Collapse multiple consecutive spaces to single space
-        text = re.sub(r" +", " ", seg.text)
+        text = _MULTI_SPACE_PATTERN.sub(" ", seg.text)
         # Collapse 3+ newlines to 2 (one paragraph break)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _MULTI_NEWLINE_PATTERN.sub("\n\n", text)
         # Remove lines that are just whitespace
-        text = re.sub(r"\n[ \t]+\n", "\n\n", text)
+        text = _BLANK_LINE_PATTERN.sub("\n\n", text)
         if text:
             final.append(StyledSegment(text=text, style=seg.style))
 
@@ -1070,10 +1133,10 @@ def _collapse_segment_newlines(segments: list[StyledSegment]) -> list[StyledSegm
         return []
 
     # Join all text, collapse newlines, then rebuild
-    full_text = "".join(s.text for s in segments)
+    full_text = "".join([s.text for s in segments])
 
     # Collapse 3+ newlines to 2
-    collapsed_text = re.sub(r"\n{3,}", "\n\n", full_text)
+    collapsed_text = _MULTI_NEWLINE_PATTERN.sub("\n\n", full_text)
 
     # If no change, return original
     if collapsed_text == full_text:
@@ -1127,7 +1190,7 @@ def _filter_tag_segments(segments: list[StyledSegment]) -> list[StyledSegment]:
         return []
 
     # Join all text and split by newlines to filter tag lines
-    full_text = "".join(s.text for s in segments)
+    full_text = "".join([s.text for s in segments])
     lines = full_text.split("\n")
 
     # Filter out tag lines
@@ -1211,6 +1274,22 @@ def render_html_to_styled_segments(
     if not html:
         return []
 
+    # The cache holds shared segments; hand out copies so callers may mutate them
+    return [
+        StyledSegment(text=seg.text, style=seg.style.copy())
+        for seg in _render_html_to_styled_segments_cached(
+            html, _media_dir_key(media_dir), mode
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=64)
+def _render_html_to_styled_segments_cached(
+    html: str,
+    media_dir: Path | None,
+    mode: RenderMode,
+) -> tuple[StyledSegment, ...]:
+    """Uncached body of render_html_to_styled_segments (hashable arguments only)."""
     # Strip duplicated FrontSide content from answer HTML
     if mode == RenderMode.ANSWER:
         html = _strip_front_side_from_answer(html)
@@ -1226,15 +1305,16 @@ def render_html_to_styled_segments(
     # Parse HTML and extract styled segments
     renderer = _HTMLToTextRenderer(media_dir=media_dir, mode=mode, styled=True)
     renderer.feed(html)
+    renderer.close()
     segments = renderer.get_segments()
 
-    # Process media tags in each segment
-    processed: list[StyledSegment] = []
-    for seg in segments:
-        text = _safe_unescape(seg.text)
-        text = _process_media_tags(text)
-        if text:
-            processed.append(StyledSegment(text=text, style=seg.style))
+    # Decode entities and media tags in each segment, streamed straight into
+    # normalization rather than collected into an intermediate list
+    processed = (
+        StyledSegment(text=text, style=seg.style)
+        for seg in segments
+        if (text := _process_media_tags(_safe_unescape(seg.text)))
+    )
 
     # Normalize segments
     normalized = _normalize_segments(processed)
@@ -1243,4 +1323,4 @@ def render_html_to_styled_segments(
     filtered = _filter_tag_segments(normalized)
 
     # Final pass: collapse excessive newlines across segment boundaries
-    return _collapse_segment_newlines(filtered)
+    return tuple(_collapse_segment_newlines(filtered))
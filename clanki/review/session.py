@@ -6,6 +6,8 @@ answering, and undo operations.
 
 from __future__ import annotations
 
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import TYPE_CHECKING, Any
@@ -15,6 +17,10 @@ if TYPE_CHECKING:
     from anki.collection import Collection
 
 
+# Seconds a deck_due_tree() result stays valid for get_counts()
+COUNTS_TTL = 0.25
+
+
 class Rating(IntEnum):
     """Card answer ratings matching Anki's scheduler."""
 
@@ -68,6 +74,27 @@ def _extract_audio_filenames(av_tags: list[Any]) -> list[str]:
     return filenames
 
 
+def _index_deck_tree(root: Any) -> dict[int, Any]:
+    """Flatten a deck_due_tree into a deck_id → node mapping.
+
+    Walks the tree breadth-first with an explicit queue so deep deck
+    hierarchies don't cost a Python frame per level.
+
+    Args:
+        root: Root node returned by ``col.sched.deck_due_tree()``.
+
+    Returns:
+        Dict mapping each deck ID in the tree to its node.
+    """
+    index: dict[int, Any] = {}
+    queue = deque([root])
+    while queue:
+        node = queue.popleft()
+        index.setdefault(node.deck_id, node)
+        queue.extend(node.children)
+    return index
+
+
 @dataclass
 class CardView:
     """View of a card for review.
@@ -109,6 +136,8 @@ class ReviewSession:
         self._current_card: CardView | None = None
         self._answered_card_ids: list[int] = []
         self._previous_flag: int | None = None
+        # (monotonic timestamp, counts) from the last deck_due_tree() call
+        self._counts_cache: tuple[float, DeckCounts] | None = None
 
         # Resolve and select deck
         self._resolve_deck(deck_name)
@@ -135,6 +164,10 @@ class ReviewSession:
             f"Available decks: {', '.join(available) if available else 'none'}"
         )
 
+    def _invalidate_counts(self) -> None:
+        """Drop cached due counts after the scheduler state changes."""
+        self._counts_cache = None
+
     @property
     def deck_id(self) -> int:
         """Get the current deck ID."""
@@ -161,33 +194,40 @@ class ReviewSession:
 
         Returns:
             DeckCounts with new, learn, and review counts.
+
+        deck_due_tree() scans the whole collection in the backend, so the
+        result is reused for COUNTS_TTL seconds. Answering, burying,
+        suspending, and undoing invalidate the cache immediately.
         """
+        now = time.monotonic()
+        if self._counts_cache is not None:
+            fetched_at, counts = self._counts_cache
+            if now - fetched_at < COUNTS_TTL:
+                return counts
+
         tree = self._col.sched.deck_due_tree()
-        return self._find_deck_counts(tree, self.deck_id)
+        counts = self._find_deck_counts(tree, self.deck_id)
+        self._counts_cache = (now, counts)
+        return counts
 
     def _find_deck_counts(self, node: Any, target_id: int) -> DeckCounts:
-        """Recursively search deck tree for counts.
+        """Look up counts for a deck in the deck tree.
 
         Args:
-            node: Current tree node.
+            node: Root tree node.
             target_id: Deck ID to find.
 
         Returns:
             DeckCounts for the target deck, or zeros if not found.
         """
-        if node.deck_id == target_id:
-            return DeckCounts(
-                new_count=node.new_count,
-                learn_count=node.learn_count,
-                review_count=node.review_count,
-            )
-
-        for child in node.children:
-            result = self._find_deck_counts(child, target_id)
-            if result.total > 0 or child.deck_id == target_id:
-                return result
-
-        return DeckCounts(new_count=0, learn_count=0, review_count=0)
+        target = _index_deck_tree(node).get(target_id)
+        if target is None:
+            return DeckCounts(new_count=0, learn_count=0, review_count=0)
+        return DeckCounts(
+            new_count=target.new_count,
+            learn_count=target.learn_count,
+            review_count=target.review_count,
+        )
 
     def next_card(self) -> CardView | None:
         """Get the next card for review.
@@ -276,6 +316,7 @@ class ReviewSession:
         # Track for undo
         self._answered_card_ids.append(self._current_card.card_id)
         self._current_card = None
+        self._invalidate_counts()
 
     def bury_card(self) -> None:
         """Bury the current card so it won't appear again today.
@@ -289,6 +330,7 @@ class ReviewSession:
         # Track for undo (col.undo() can reverse bury)
         self._answered_card_ids.append(self._current_card.card_id)
         self._current_card = None
+        self._invalidate_counts()
 
     def suspend_card(self) -> None:
         """Suspend the current card (remove from future reviews until unsuspended).
@@ -302,6 +344,7 @@ class ReviewSession:
         # Track for undo (col.undo() can reverse suspend)
         self._answered_card_ids.append(self._current_card.card_id)
         self._current_card = None
+        self._invalidate_counts()
 
     def set_card_flag(self, flag: int) -> None:
         """Set a flag on the current card.
@@ -352,6 +395,7 @@ class ReviewSession:
             self._col.undo()
         except Exception as exc:
             raise UndoError(f"Undo failed: {exc}") from exc
+        self._invalidate_counts()
 
         # Re-fetch the card
         card_id = self._answered_card_ids.pop()
@@ -8,7 +8,7 @@ This module provides the main Textual App that manages:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,30 +23,39 @@ class SessionStats:
     """Statistics for the current review session."""
 
     reviewed: int = 0
-    again_count: int = 0
-    hard_count: int = 0
-    good_count: int = 0
-    easy_count: int = 0
+    # Per-rating answer counts indexed by rating (1-4); slot 0 is unused
+    rating_counts: list[int] = field(default_factory=lambda: [0] * 5)
+
+    @property
+    def again_count(self) -> int:
+        """Number of cards answered Again."""
+        return self.rating_counts[1]
+
+    @property
+    def hard_count(self) -> int:
+        """Number of cards answered Hard."""
+        return self.rating_counts[2]
+
+    @property
+    def good_count(self) -> int:
+        """Number of cards answered Good."""
+        return self.rating_counts[3]
+
+    @property
+    def easy_count(self) -> int:
+        """Number of cards answered Easy."""
+        return self.rating_counts[4]
 
     def record_answer(self, rating: int) -> None:
         """Record an answer with the given rating (1-4)."""
         self.reviewed += 1
-        if rating == 1:
-            self.again_count += 1
-        elif rating == 2:
-            self.hard_count += 1
-        elif rating == 3:
-            self.good_count += 1
-        elif rating == 4:
-            self.easy_count += 1
+        if 0 < rating < len(self.rating_counts):
+            self.rating_counts[rating] += 1
 
     def reset(self) -> None:
         """Reset all statistics."""
         self.reviewed = 0
-        self.again_count = 0
-        self.hard_count = 0
-        self.good_count = 0
-        self.easy_count = 0
+        self.rating_counts = [0] * 5
 
 
 @dataclass
@@ -235,7 +244,7 @@ class ClankiApp(App[None]):
             audio_enabled=audio_enabled,
             audio_autoplay=audio_autoplay,
             high_contrast=config.high_contrast,
-            expanded_decks=config.expanded_decks.copy(),
+            expanded_decks=set(config.expanded_decks),
         )
 
     @property
@@ -294,10 +303,15 @@ class ClankiApp(App[None]):
         """Save expanded_decks state to persistent config."""
         from ..config_store import load_config, save_config
 
+        # The loaded config is the shared cached instance; save a copy instead
         config = load_config()
-        config.expanded_decks = self._state.expanded_decks.copy()
-        config.high_contrast = self._state.high_contrast
-        save_config(config)
+        updated = replace(
+            config,
+            expanded_decks=frozenset(self._state.expanded_decks),
+            high_contrast=self._state.high_contrast,
+        )
+        if updated != config:
+            save_config(updated)
 
 
 def run_tui(
@@ -7,6 +7,7 @@ audio placeholder icon substitution and styled text rendering.
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,13 +19,21 @@ from rich.text import Text
 from ..audio import substitute_audio_icons
 from ..render import RenderMode, StyledSegment, render_html_to_styled_segments
 
-# Pattern to match [image: filename] placeholders
-IMAGE_PLACEHOLDER_PATTERN = re.compile(r"\[image:\s*([^\]]+)\]")
+# Pattern to match [image: filename] placeholders. Surrounding whitespace is
+# captured and stripped by callers: a separate \s* before the filename class
+# (which also matches spaces) backtracks quadratically on long blank runs.
+IMAGE_PLACEHOLDER_PATTERN = re.compile(r"\[image:([^\]]+)\]")
 
+# CSS compound color names Rich spells with an underscore (darkgreen -> dark_green)
+_COMPOUND_COLOR_PATTERN = re.compile(r"(light|dark|medium|pale|deep)(.*)")
 
-@dataclass
+# rgb(r, g, b) color values
+_RGB_COLOR_PATTERN = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)")
+
+
+@dataclass(slots=True)
 class ImagePlaceholder:
-    """Represents an image placeholder found in card text."""
+    """Represents an image placeholder found in card text (one per match, so slotted)."""
 
     filename: str
     start: int
@@ -40,16 +49,14 @@ def parse_image_placeholders(text: str) -> list[ImagePlaceholder]:
     Returns:
         List of ImagePlaceholder objects with filename and position.
     """
-    placeholders = []
-    for match in IMAGE_PLACEHOLDER_PATTERN.finditer(text):
-        placeholders.append(
-            ImagePlaceholder(
-                filename=match.group(1).strip(),
-                start=match.start(),
-                end=match.end(),
-            )
-        )
-    return placeholders
+    # Most cards have no images; a substring check is far cheaper than the regex
+    if "[image:" not in text:
+        return []
+
+    return [
+        ImagePlaceholder(filename=match[1].strip(), start=match.start(), end=match.end())
+        for match in IMAGE_PLACEHOLDER_PATTERN.finditer(text)
+    ]
 
 
 def is_image_support_available() -> bool:
@@ -93,6 +100,29 @@ def _create_image_renderable(
     return ImageMarker(path=image_path)
 
 
+def _resolve_image(
+    filename: str,
+    media_dir: Path | None,
+    max_width: int | None,
+    max_height: int | None,
+    resolved: dict[str, ImageMarker | None],
+) -> RenderableType | ImageMarker:
+    """Resolve one image placeholder to an ImageMarker or fallback text.
+
+    ``resolved`` memoizes lookups for the current card, so an image that
+    appears several times is only checked on disk once.
+    """
+    if filename not in resolved:
+        resolved[filename] = (
+            _create_image_renderable(media_dir / filename, max_width, max_height)
+            if media_dir is not None
+            else None
+        )
+    img = resolved[filename]
+    # Fall back to placeholder text if the image can't be shown
+    return img if img is not None else Text(f"[image: {filename}]")
+
+
 def render_content_with_images(
     text: str,
     media_dir: Path | None,
@@ -121,43 +151,30 @@ def render_content_with_images(
     # First, substitute audio placeholders with icons
     text = substitute_audio_icons(text)
 
-    placeholders = parse_image_placeholders(text)
+    # If images disabled or no placeholders, return text as-is
+    if not images_enabled or "[image:" not in text:
+        return [Text(text)]
 
-    # If no placeholders or images disabled, return text as-is
-    if not placeholders or not images_enabled:
+    # The pattern's capture group makes split() alternate between surrounding
+    # text (even indices) and placeholder filenames (odd indices) in one scan
+    parts = IMAGE_PLACEHOLDER_PATTERN.split(text)
+    if len(parts) == 1:
         return [Text(text)]
 
     # Build list of renderables, preserving whitespace
     renderables: list[RenderableType | ImageMarker] = []
-    last_end = 0
+    resolved: dict[str, ImageMarker | None] = {}
+
+    for index, part in enumerate(parts):
+        if not index % 2:
+            # Text between placeholders (preserve whitespace)
+            if part:
+                renderables.append(Text(part))
+            continue
 
-    for placeholder in placeholders:
-        # Add text before this placeholder (preserve whitespace)
-        if placeholder.start > last_end:
-            text_before = text[last_end : placeholder.start]
-            if text_before:
-                renderables.append(Text(text_before))
-
-        # Try to render the image
-        image_rendered = False
-        if media_dir is not None:
-            image_path = media_dir / placeholder.filename
-            img = _create_image_renderable(image_path, max_width, max_height)
-            if img is not None:
-                renderables.append(img)
-                image_rendered = True
-
-        # Fall back to placeholder text if image rendering failed
-        if not image_rendered:
-            renderables.append(Text(f"[image: {placeholder.filename}]"))
-
-        last_end = placeholder.end
-
-    # Add remaining text after last placeholder (preserve whitespace)
-    if last_end < len(text):
-        text_after = text[last_end:]
-        if text_after:
-            renderables.append(Text(text_after))
+        renderables.append(
+            _resolve_image(part.strip(), media_dir, max_width, max_height, resolved)
+        )
 
     return renderables if renderables else [Text(text)]
 
@@ -337,13 +354,7 @@ def _parse_rich_color(css_color: str) -> str | None:
         pass
     # Try inserting underscores at camelCase / compound boundaries
     # e.g. "lightblue" -> "light_blue", "darkgreen" -> "dark_green"
-    import re as _re
-
-    underscored = _re.sub(
-        r"(light|dark|medium|pale|deep)(.*)",
-        lambda m: m.group(1) + "_" + m.group(2),
-        css_color,
-    )
+    underscored = _COMPOUND_COLOR_PATTERN.sub(r"\1_\2", css_color)
     if underscored != css_color:
         try:
             Color.parse(underscored)
@@ -377,7 +388,7 @@ def _color_to_rgb(color_str: str) -> tuple[int, int, int] | None:
             b = int(hexval[4:6], 16)
             return (r, g, b)
         return None
-    rgb_match = re.match(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color_str)
+    rgb_match = _RGB_COLOR_PATTERN.match(color_str)
     if rgb_match:
         return (int(rgb_match.group(1)), int(rgb_match.group(2)), int(rgb_match.group(3)))
     return None
@@ -427,22 +438,52 @@ def _segment_to_rich_style(
     segment: StyledSegment, *, high_contrast: bool = False
 ) -> Style:
     """Convert a StyledSegment's style to a Rich Style object."""
+    style = segment.style
+    return _rich_style(
+        style.bold,
+        style.italic,
+        style.underline,
+        style.strikethrough,
+        style.color,
+        style.bgcolor,
+        style.is_cloze,
+        high_contrast,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _rich_style(
+    bold: bool,
+    italic: bool,
+    underline: bool,
+    strikethrough: bool,
+    color: str | None,
+    bgcolor: str | None,
+    is_cloze: bool,
+    high_contrast: bool,
+) -> Style:
+    """Build the Rich Style for a set of segment style attributes.
+
+    Cached because a card reuses a handful of styles across many segments,
+    and color parsing plus contrast adjustment is the costly part. TextStyle
+    itself is mutable (unhashable), hence the flattened arguments.
+    """
     style_kwargs: dict[str, object] = {}
 
-    if segment.style.bold:
+    if bold:
         style_kwargs["bold"] = True
 
-    if segment.style.italic:
+    if italic:
         style_kwargs["italic"] = True
 
-    if segment.style.underline:
+    if underline:
         style_kwargs["underline"] = True
 
-    if segment.style.strikethrough:
+    if strikethrough:
         style_kwargs["strike"] = True
 
-    if segment.style.color:
-        parsed = _parse_rich_color(segment.style.color)
+    if color:
+        parsed = _parse_rich_color(color)
         if parsed is not None:
             if high_contrast:
                 adjusted = _adjust_for_contrast(parsed, is_bg=False)
@@ -452,8 +493,8 @@ def _segment_to_rich_style(
             else:
                 style_kwargs["color"] = parsed
 
-    if segment.style.bgcolor:
-        parsed = _parse_rich_color(segment.style.bgcolor)
+    if bgcolor:
+        parsed = _parse_rich_color(bgcolor)
         if parsed is not None:
             if high_contrast:
                 adjusted = _adjust_for_contrast(parsed, is_bg=True)
@@ -465,7 +506,7 @@ def _segment_to_rich_style(
                 style_kwargs["bgcolor"] = parsed
 
     # Special cloze styling: bold + reverse for visibility
-    if segment.style.is_cloze:
+    if is_cloze:
         style_kwargs["bold"] = True
         style_kwargs["reverse"] = True
 
@@ -484,11 +525,12 @@ def segments_to_rich_text(
     Returns:
         Rich Text object with appropriate styling applied.
     """
-    text = Text()
-    for segment in segments:
-        style = _segment_to_rich_style(segment, high_contrast=high_contrast)
-        text.append(segment.text, style=style)
-    return text
+    return Text.assemble(
+        *[
+            (segment.text, _segment_to_rich_style(segment, high_contrast=high_contrast))
+            for segment in segments
+        ]
+    )
 
 
 def render_styled_content_with_images(
@@ -525,57 +567,50 @@ def render_styled_content_with_images(
     if not segments:
         return []
 
+    # Check for audio placeholders on the joined segment text, so the Rich
+    # Text is only built once, from segments that already carry the icons
+    plain_text = "".join([seg.text for seg in segments])
+    if substitute_audio_icons(plain_text) != plain_text:
+        segments = [
+            StyledSegment(text=substitute_audio_icons(seg.text), style=seg.style)
+            for seg in segments
+        ]
+
     # Convert segments to Rich Text
     styled_text = segments_to_rich_text(segments, high_contrast=high_contrast)
-
-    # Apply audio icon substitution to the plain text representation
     plain_text = str(styled_text)
-    plain_with_audio = substitute_audio_icons(plain_text)
-
-    # If audio icons were substituted, we need to rebuild the text
-    # For simplicity, if there are audio placeholders, apply substitution
-    if plain_with_audio != plain_text:
-        # Rebuild by applying audio substitution to each segment's text
-        new_segments: list[StyledSegment] = []
-        for seg in segments:
-            new_text = substitute_audio_icons(seg.text)
-            new_segments.append(StyledSegment(text=new_text, style=seg.style))
-        styled_text = segments_to_rich_text(new_segments, high_contrast=high_contrast)
-        plain_text = str(styled_text)
-
-    # Parse image placeholders from the text
-    placeholders = parse_image_placeholders(plain_text)
-
-    # If no image placeholders or images disabled, return styled text as-is
-    if not placeholders or not images_enabled:
+
+    # With images disabled the placeholders stay as text; don't scan for them
+    if not images_enabled:
         return [styled_text]
 
-    # Build list of renderables, replacing image placeholders with ImageMarkers
+    if "[image:" not in plain_text:
+        return [styled_text]
+
+    # Build list of renderables, replacing image placeholders with ImageMarkers.
+    # Matches are consumed as they are found, with no placeholder list in between.
     renderables: list[RenderableType | ImageMarker] = []
+    resolved: dict[str, ImageMarker | None] = {}
     last_end = 0
 
     # We need to slice the Rich Text object at placeholder positions
-    for placeholder in placeholders:
+    for match in IMAGE_PLACEHOLDER_PATTERN.finditer(plain_text):
+        start, end = match.span()
         # Add styled text before this placeholder
-        if placeholder.start > last_end:
-            text_slice = styled_text[last_end:placeholder.start]
+        if start > last_end:
+            text_slice = styled_text[last_end:start]
             if len(text_slice) > 0:
                 renderables.append(text_slice)
 
-        # Try to render the image
-        image_rendered = False
-        if media_dir is not None:
-            image_path = media_dir / placeholder.filename
-            img = _create_image_renderable(image_path, max_width, max_height)
-            if img is not None:
-                renderables.append(img)
-                image_rendered = True
+        renderables.append(
+            _resolve_image(match[1].strip(), media_dir, max_width, max_height, resolved)
+        )
 
-        # Fall back to placeholder text if image rendering failed
-        if not image_rendered:
-            renderables.append(Text(f"[image: {placeholder.filename}]"))
+        last_end = end
 
-        last_end = placeholder.end
+    if not last_end:
+        # Marker text without a well-formed placeholder
+        return [styled_text]
 
     # Add remaining styled text after last placeholder
     if last_end < len(plain_text):
@@ -6,6 +6,7 @@ allowing users to select a deck to start a review session.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -39,7 +40,7 @@ class DeckInfo:
         """Total number of cards due."""
         return self.new_count + self.learn_count + self.review_count
 
-    @property
+    @functools.cached_property
     def display_name(self) -> str:
         """Format deck name for display (show only leaf name with indent)."""
         parts = self.name.split("::")
@@ -73,16 +74,26 @@ class DeckNode:
         """Total number of cards due."""
         return self.new_count + self.learn_count + self.review_count
 
-    @property
+    @functools.cached_property
     def leaf_name(self) -> str:
-        """Get the leaf part of the deck name."""
-        parts = self.name.split("::")
-        return parts[-1] if parts else self.name
+        """Get the leaf part of the deck name (computed once per node)."""
+        return self.name.rpartition("::")[2]
 
     def format_counts(self) -> str:
         """Format counts as new/learn/review string."""
         return f"{self.new_count}/{self.learn_count}/{self.review_count}"
 
+    @functools.cached_property
+    def label_markup(self) -> str:
+        """Rich markup for the deck name and color-coded counts (built once per node)."""
+        # Color-coded counts: new=blue, learn=red, review=green
+        colored_counts = (
+            f"[#5eb5f7]{self.new_count}[/#5eb5f7]/"
+            f"[#e96c6c]{self.learn_count}[/#e96c6c]/"
+            f"[#6cd97e]{self.review_count}[/#6cd97e]"
+        )
+        return f"[bold]{self.leaf_name}[/bold]  [dim]({colored_counts})[/dim]"
+
 
 class DeckListItem(ListItem):
     """A list item representing a deck."""
@@ -101,17 +112,7 @@ class DeckListItem(ListItem):
         else:
             indicator = "  "
 
-        # Color-coded counts: new=blue, learn=red, review=green
-        colored_counts = (
-            f"[#5eb5f7]{self.node.new_count}[/#5eb5f7]/"
-            f"[#e96c6c]{self.node.learn_count}[/#e96c6c]/"
-            f"[#6cd97e]{self.node.review_count}[/#6cd97e]"
-        )
-
-        yield Static(
-            f"{indent}{indicator}[bold]{self.node.leaf_name}[/bold]  [dim]({colored_counts})[/dim]",
-            markup=True,
-        )
+        yield Static(indent + indicator + self.node.label_markup, markup=True)
 
 
 class DeckPickerScreen(Screen[str]):
@@ -141,6 +142,10 @@ class DeckPickerScreen(Screen[str]):
         self._deck_tree: list[DeckNode] = []
         self._visible_nodes: list[DeckNode] = []
         self._filter_text: str = ""
+        # Lowercased full deck names by ID, rebuilt on each load for filtering
+        self._lower_names: dict[int, str] = {}
+        # What the list currently shows, so unchanged rows aren't remounted
+        self._list_signature: tuple[tuple[object, ...], ...] | None = None
 
     @property
     def clanki_app(self) -> "ClankiApp":
@@ -233,6 +238,7 @@ class DeckPickerScreen(Screen[str]):
 
         tree = col.sched.deck_due_tree()
         self._deck_tree = self._build_tree(tree)
+        self._lower_names = {}
 
         # Initialize expanded state for top-level decks on first load
         if not self._expanded_decks:
@@ -241,17 +247,38 @@ class DeckPickerScreen(Screen[str]):
                     self._expanded_decks.add(node.deck_id)
 
     def _build_node(self, node: Any, depth: int) -> DeckNode:
-        """Build a single DeckNode with its direct children only."""
-        children = [self._build_node(child, depth + 1) for child in node.children]
-        return DeckNode(
+        """Build a DeckNode and its whole subtree.
+
+        Uses an explicit stack rather than recursion so large deck
+        hierarchies don't pay per-level call overhead. Children are pushed
+        in reverse so each parent's list keeps Anki's order.
+        """
+        root = DeckNode(
             deck_id=node.deck_id,
             name=node.name,
             new_count=node.new_count,
             learn_count=node.learn_count,
             review_count=node.review_count,
             depth=depth,
-            children=children,
+            children=[],
         )
+        stack = [(child, depth + 1, root.children) for child in reversed(node.children)]
+        while stack:
+            src, child_depth, siblings = stack.pop()
+            built = DeckNode(
+                deck_id=src.deck_id,
+                name=src.name,
+                new_count=src.new_count,
+                learn_count=src.learn_count,
+                review_count=src.review_count,
+                depth=child_depth,
+                children=[],
+            )
+            siblings.append(built)
+            stack.extend(
+                (child, child_depth + 1, built.children) for child in reversed(src.children)
+            )
+        return root
 
     def _build_tree(self, root: Any) -> list[DeckNode]:
         """Build tree structure from Anki's deck_due_tree root."""
@@ -268,12 +295,16 @@ class DeckPickerScreen(Screen[str]):
         If a child matches, all ancestor nodes are included to show the path.
         """
         q = query.lower()
+        lower_names = self._lower_names
 
         def filter_nodes(node_list: list[DeckNode]) -> list[DeckNode]:
             result: list[DeckNode] = []
             for node in node_list:
                 # Check if this node's full name matches
-                name_matches = q in node.name.lower()
+                name_lower = lower_names.get(node.deck_id)
+                if name_lower is None:
+                    name_lower = lower_names[node.deck_id] = node.name.lower()
+                name_matches = q in name_lower
                 # Recursively filter children
                 filtered_children = filter_nodes(node.children)
 
@@ -302,15 +333,17 @@ class DeckPickerScreen(Screen[str]):
             filtered = nodes
 
         result: list[DeckNode] = []
-
-        def walk(node_list: list[DeckNode]) -> None:
-            for node in node_list:
-                result.append(node)
-                # When filtering, always expand to show matches; otherwise use expand state
-                if self._filter_text or node.deck_id in self._expanded_decks:
-                    walk(node.children)
-
-        walk(filtered)
+        expand_all = bool(self._filter_text)
+        expanded = self._expanded_decks
+
+        # Pre-order walk with an explicit stack (reversed pushes keep display order)
+        stack = list(reversed(filtered))
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            # When filtering, always expand to show matches; otherwise use expand state
+            if expand_all or node.deck_id in expanded:
+                stack.extend(reversed(node.children))
         return result
 
     def _update_list(self, restore_deck_id: int | None = None) -> None:
@@ -326,9 +359,31 @@ class DeckPickerScreen(Screen[str]):
             if isinstance(list_view.highlighted_child, DeckListItem):
                 restore_deck_id = list_view.highlighted_child.node.deck_id
 
+        visible_nodes = self._get_visible_nodes(self._deck_tree)
+
+        # Skip the clear + remount when every row would render identically
+        # (e.g. a filter keystroke that doesn't change the matches)
+        signature = tuple(
+            (
+                node.deck_id,
+                node.name,
+                node.depth,
+                len(node.children),
+                node.deck_id in self._expanded_decks,
+                node.new_count,
+                node.learn_count,
+                node.review_count,
+            )
+            for node in visible_nodes
+        )
+        if signature == self._list_signature and len(list_view) == len(visible_nodes):
+            self._visible_nodes = visible_nodes
+            return
+        self._list_signature = signature
+
         list_view.clear()
 
-        self._visible_nodes = self._get_visible_nodes(self._deck_tree)
+        self._visible_nodes = visible_nodes
 
         for node in self._visible_nodes:
             is_expanded = node.deck_id in self._expanded_decks
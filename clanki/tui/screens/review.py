@@ -9,7 +9,10 @@ This screen handles the card review flow:
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import threading
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
@@ -17,6 +20,7 @@ from textual.binding import Binding
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
 from ...audio import (
     get_audio_unavailable_message,
@@ -26,7 +30,7 @@ from ...audio import (
     stop_audio,
 )
 from ...config_store import load_config, save_config
-from ...render import render_html_to_text
+from ...render import RenderMode, render_html_to_styled_segments, render_html_to_text
 from ...review import CardView, DeckNotFoundError, Rating, ReviewSession, UndoError
 from ..widgets.card_view import CardViewWidget
 from ..widgets.stats_bar import DeckCountsBar, StatsBar
@@ -34,16 +38,41 @@ from ..widgets.stats_bar import DeckCountsBar, StatsBar
 if TYPE_CHECKING:
     from ..app import ClankiApp
 
+# Worker group for answer prefetches, cancelled whenever the card changes
+_PREFETCH_WORKER_GROUP = "answer-prefetch"
+
+
+def _prefetch_answer_render(answer_html: str, media_dir: Path | None) -> None:
+    """Warm the render caches for a card's answer side.
+
+    Runs in a thread worker while the question is shown so that revealing
+    the answer (styled view plus audio text) hits the caches.
+    """
+    with contextlib.suppress(Exception):
+        render_html_to_styled_segments(answer_html, media_dir, RenderMode.ANSWER)
+        # The card may have changed while rendering
+        if get_current_worker().is_cancelled:
+            return
+        render_html_to_text(answer_html, media_dir=media_dir)
+
 
 def _persist_config_from_state(state) -> None:
-    """Persist runtime toggle settings without dropping other config fields."""
+    """Persist runtime toggle settings without dropping other config fields.
+
+    The cached config is replaced rather than mutated, so a toggle that
+    leaves every setting as already saved skips the disk write.
+    """
     config = load_config()
-    config.images_enabled = state.images_enabled
-    config.audio_enabled = state.audio_enabled
-    config.audio_autoplay = state.audio_autoplay
-    config.high_contrast = state.high_contrast
-    config.expanded_decks = state.expanded_decks.copy()
-    save_config(config)
+    updated = dataclasses.replace(
+        config,
+        images_enabled=state.images_enabled,
+        audio_enabled=state.audio_enabled,
+        audio_autoplay=state.audio_autoplay,
+        high_contrast=state.high_contrast,
+        expanded_decks=frozenset(state.expanded_decks),
+    )
+    if updated != config:
+        save_config(updated)
 
 
 class ReviewScreen(Screen[None]):
@@ -275,6 +304,21 @@ class ReviewScreen(Screen[None]):
         self._current_flag = self._current_card.card.user_flag()
 
         self._display_card()
+        self._start_answer_prefetch()
+
+    def _start_answer_prefetch(self) -> None:
+        """Render the current card's answer in the background (think time)."""
+        # A previous card's prefetch is no longer useful
+        self.workers.cancel_group(self, _PREFETCH_WORKER_GROUP)
+        if self._current_card is None:
+            return
+        answer_html = self._current_card.answer_html
+        media_dir = self.clanki_app.state.media_dir
+
+        def prefetch() -> None:
+            _prefetch_answer_render(answer_html, media_dir)
+
+        self.run_worker(prefetch, thread=True, group=_PREFETCH_WORKER_GROUP, exit_on_error=False)
 
     def _update_title_with_flag(self) -> None:
         """Update the deck title Static to include a flag indicator if flagged."""
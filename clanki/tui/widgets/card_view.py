@@ -2,26 +2,103 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from textual import events
 from textual.containers import Vertical
 from textual.widget import Widget
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
+from rich.console import RenderableType
+from rich.text import Text
 from textual_image.widget import Image as ImageWidget
 
 from ...render import RenderMode
 from ..render import ImageMarker, render_styled_content_with_images
 from .iterm2_image import ITerm2Image
 
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
 logger = logging.getLogger(__name__)
 
+# Worker group for background image decodes, cancelled on each re-render
+_IMAGE_WORKER_GROUP = "card-images"
+
+# Largest decoded image kept in memory, in pixels per side. Card images are
+# shown at most CardView.MAX_IMAGE_WIDTH x MAX_IMAGE_HEIGHT cells, which stays
+# under this even with large (HiDPI) terminal cells.
+_MAX_DECODED_SIZE = (1024, 1024)
+
+
+@functools.lru_cache(maxsize=256)
+def _image_pixel_size(path: Path, mtime_ns: int) -> tuple[int, int]:
+    """Read an image's pixel dimensions, cached per (path, mtime).
+
+    Cards are re-laid out on every reveal and resize; only the header is
+    read, but that still costs an open + decode of the file's metadata.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        return img.size
+
+
+@functools.lru_cache(maxsize=4)
+def _decoded_image(path: Path, mtime_ns: int) -> PILImage.Image:
+    """Decode an image file once, cached per (path, mtime).
 
+    textual-image re-opens and decodes a path every time a widget is
+    created; handing it an already decoded image (which it copies before
+    scaling) avoids that on every reveal, toggle and resize. Large images
+    are downscaled to what the card can display before caching. Called from
+    worker threads; callers must not mutate the result.
+    """
+    from PIL import Image as PILImage
+
+    with PILImage.open(path) as img:
+        img.thumbnail(_MAX_DECODED_SIZE)
+        return img.copy()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_renderables(
+    html: str,
+    media_dir: Path | None,
+    images_enabled: bool,
+    mode: RenderMode,
+    max_width: int | None,
+    max_height: int | None,
+    high_contrast: bool,
+) -> tuple[RenderableType | ImageMarker, ...]:
+    """Render card content once per distinct set of display options.
+
+    Flipping between question and answer, or toggling images/contrast back,
+    re-shows content that was already rendered; this skips redoing the
+    HTML parse, styling and image lookups. Callers must copy Text items
+    before handing them to widgets.
+    """
+    return tuple(
+        render_styled_content_with_images(
+            html=html,
+            media_dir=media_dir,
+            images_enabled=images_enabled,
+            mode=mode,
+            max_width=max_width,
+            max_height=max_height,
+            high_contrast=high_contrast,
+        )
+    )
+
+
+@functools.cache
 def _is_warp_terminal() -> bool:
-    """Check if running in Warp terminal."""
+    """Check if running in Warp terminal (the terminal can't change mid-run)."""
     return "warp" in os.environ.get("TERM_PROGRAM", "").lower()
 
 
@@ -70,6 +147,9 @@ class CardViewWidget(Vertical):
         self._images_enabled = images_enabled
         self._high_contrast = high_contrast
         self._last_width: int = 0  # Track width to avoid unnecessary re-renders
+        # Inputs of the last successful mount; an identical refresh is skipped
+        self._last_render_key: tuple[object, ...] | None = None
+        self._refresh_pending = False  # A resize-driven refresh is scheduled
 
     def set_media_dir(self, media_dir: Path | None) -> None:
         """Set the media directory for image loading."""
@@ -91,9 +171,7 @@ class CardViewWidget(Vertical):
         Args:
             question_html: Raw HTML content for the question side.
         """
-        self._question_html = question_html
-        self._answer_html = None
-        self._refresh_content()
+        self._show(question_html, None)
 
     def show_answer(self, question_html: str, answer_html: str) -> None:
         """Display both question and answer.
@@ -102,6 +180,10 @@ class CardViewWidget(Vertical):
             question_html: Raw HTML content for the question side.
             answer_html: Raw HTML content for the answer side.
         """
+        self._show(question_html, answer_html)
+
+    def _show(self, question_html: str, answer_html: str | None) -> None:
+        """Update the displayed card (a no-op if it is already shown)."""
         self._question_html = question_html
         self._answer_html = answer_html
         self._refresh_content()
@@ -117,24 +199,16 @@ class CardViewWidget(Vertical):
         Returns:
             Tuple of (max_width, max_height) in terminal cells.
         """
-        try:
-            # content_region accounts for widget's own padding
-            region = self.content_region
-
-            # If size isn't known yet (pre-layout), use defaults
-            if region.width <= 0:
-                return (None, self.MAX_IMAGE_HEIGHT)
-
-            # Subtract card-section chrome: border (1 each side) + padding (2h each side)
-            width = region.width - 6
-
-            if width <= 0:
-                return (None, self.MAX_IMAGE_HEIGHT)
+        # content_region accounts for widget's own padding; subtract card-section
+        # chrome: border (1 each side) + padding (2h each side)
+        width = self.content_region.width - 6
 
-            return (max(10, width), self.MAX_IMAGE_HEIGHT)
-        except Exception:
+        # If size isn't known yet (pre-layout) or is too small, use defaults
+        if width <= 0:
             return (None, self.MAX_IMAGE_HEIGHT)
 
+        return (max(10, width), self.MAX_IMAGE_HEIGHT)
+
     def _make_image_widget(
         self, path: Path, max_width: int | None, max_height: int | None
     ) -> Widget:
@@ -147,12 +221,15 @@ class CardViewWidget(Vertical):
 
         Warp terminal uses the iTerm2 widget; others use textual-image.
         """
-        from PIL import Image as PILImage
-
         # Read real image dimensions
         try:
-            with PILImage.open(path) as img:
-                img_w, img_h = img.size
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            # Nothing could ever load into an image widget; show the text
+            # placeholder instead of an empty box
+            return Static(Text(f"[image: {path.name}]"), classes="content")
+        try:
+            img_w, img_h = _image_pixel_size(path, mtime_ns)
         except Exception:
             img_w, img_h = 1, 1
 
@@ -178,13 +255,39 @@ class CardViewWidget(Vertical):
         if _is_warp_terminal():
             widget: Widget = ITerm2Image(path, classes="card-image")
         else:
-            widget = ImageWidget(path, classes="card-image")
+            # Mount an empty placeholder now so the card's text appears
+            # immediately; the decoded image is filled in when ready
+            widget = ImageWidget(classes="card-image")
+            self._load_image_in_background(widget, path, mtime_ns)
 
         # Fixed dimensions prevent layout oscillation / scroll jitter
         widget.styles.width = display_w
         widget.styles.height = display_h
         return widget
 
+    def _load_image_in_background(self, widget: Widget, path: Path, mtime_ns: int) -> None:
+        """Decode an image on a worker thread and hand it to its widget."""
+
+        def load() -> None:
+            try:
+                decoded = _decoded_image(path, mtime_ns)
+            except Exception as exc:
+                logger.warning("Could not load image %s: %s", path, exc)
+                decoded = None
+            # The card may have been re-rendered while decoding
+            if get_current_worker().is_cancelled:
+                return
+            if decoded is None:
+                # Drop the empty placeholder rather than leave a blank gap
+                def remove_placeholder() -> None:
+                    widget.remove()
+
+                self.app.call_from_thread(remove_placeholder)
+            else:
+                self.app.call_from_thread(setattr, widget, "image", decoded)
+
+        self.run_worker(load, thread=True, group=_IMAGE_WORKER_GROUP, exit_on_error=False)
+
     def _render_section_content(
         self, html: str, mode: RenderMode = RenderMode.ANSWER
     ) -> list[Widget]:
@@ -200,14 +303,14 @@ class CardViewWidget(Vertical):
         try:
             max_width, max_height = self._get_max_image_size()
 
-            renderables = render_styled_content_with_images(
-                html=html,
-                media_dir=self._media_dir,
-                images_enabled=self._images_enabled,
-                mode=mode,
-                max_width=max_width,
-                max_height=max_height,
-                high_contrast=self._high_contrast,
+            renderables = _cached_renderables(
+                html,
+                self._media_dir,
+                self._images_enabled,
+                mode,
+                max_width,
+                max_height,
+                self._high_contrast,
             )
 
             widgets: list[Widget] = []
@@ -219,6 +322,9 @@ class CardViewWidget(Vertical):
                         )
                     )
                 else:
+                    # Cached Text is shared between renders; give each widget its own
+                    if isinstance(renderable, Text):
+                        renderable = renderable.copy()
                     widgets.append(Static(renderable, classes="content"))
 
             return widgets if widgets else [Static(html, classes="content")]
@@ -228,30 +334,49 @@ class CardViewWidget(Vertical):
             return [Static(html, classes="content")]
 
     def _refresh_content(self) -> None:
-        """Refresh the widget content."""
+        """Refresh the widget content.
+
+        Skips the remove/render/mount cycle when nothing that affects the
+        output changed since the last mount (same card side, options and
+        image size limits), e.g. a redundant show or a toggle back.
+        """
+        render_key = (
+            self._question_html,
+            self._answer_html,
+            self._media_dir,
+            self._images_enabled,
+            self._high_contrast,
+            self._get_max_image_size(),
+        )
+        if render_key == self._last_render_key and self.children:
+            return
+        self._last_render_key = None
+
+        # Image loads for the outgoing content are no longer needed
+        self.workers.cancel_group(self, _IMAGE_WORKER_GROUP)
+
+        # The answer view includes the question, so only one side is rendered
+        if self._answer_html is not None:
+            active_html, mode = self._answer_html, RenderMode.ANSWER
+        else:
+            active_html, mode = self._question_html, RenderMode.QUESTION
+
         try:
             self.remove_children()  # Remove from self, not #card-content
 
-            if self._answer_html is not None:
-                content_widgets = self._render_section_content(
-                    self._answer_html, mode=RenderMode.ANSWER
-                )
-            else:
-                content_widgets = self._render_section_content(
-                    self._question_html, mode=RenderMode.QUESTION
-                )
+            content_widgets = self._render_section_content(active_html, mode=mode)
 
             content_section = Vertical(
                 *content_widgets,
                 classes="card-section",
             )
             self.mount(content_section)  # Mount directly to self
+            self._last_render_key = render_key
         except Exception as exc:
             logger.warning("Card content mounting failed, trying fallback: %s", exc)
             try:
                 self.remove_children()
-                html = self._answer_html if self._answer_html else self._question_html
-                self.mount(Static(html, classes="content"))
+                self.mount(Static(active_html, classes="content"))
             except Exception as fallback_exc:
                 logger.error("Fallback mounting also failed: %s", fallback_exc)
 
@@ -265,4 +390,20 @@ class CardViewWidget(Vertical):
         if abs(current_width - self._last_width) >= 4:
             self._last_width = current_width
             if self._images_enabled and (self._question_html or self._answer_html):
-                self._refresh_content()
+                self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce resize-driven refreshes into one per frame.
+
+        Dragging the terminal edge emits a burst of resize events; only the
+        size after the burst matters, so at most one refresh is queued.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_after_refresh(self._do_scheduled_refresh)
+
+    def _do_scheduled_refresh(self) -> None:
+        """Run the refresh queued by _schedule_refresh."""
+        self._refresh_pending = False
+        self._refresh_content()
@@ -8,6 +8,7 @@ Credit: Pluto4o4 (https://github.com/alvenw/clanki/pull/2)
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
 from typing import Iterable, NamedTuple
@@ -33,8 +34,13 @@ class _CellSize(NamedTuple):
     height: int
 
 
+@functools.cache
 def _get_cell_size() -> _CellSize:
-    """Get terminal cell size. Returns default if detection fails."""
+    """Get terminal cell size. Returns default if detection fails.
+
+    Memoized: textual-image only queries the terminal once per process, so
+    there is nothing to gain from repeating the lookup on every frame.
+    """
     try:
         from textual_image._terminal import get_cell_size
 
@@ -44,28 +50,85 @@ def _get_cell_size() -> _CellSize:
         return _CellSize(10, 20)  # Default fallback
 
 
+@functools.lru_cache(maxsize=2)
+def _load_source(image_path: Path, mtime: float) -> PILImage.Image:
+    """Decode an image file to RGBA once and keep it for later resizes.
+
+    Re-encoding at a new cell size (e.g. after a terminal resize) then only
+    costs a resize, not another decode. Full-resolution decodes are large, so
+    only the most recent couple are kept. Callers must not mutate the result.
+    """
+    with PILImage.open(image_path) as img:
+        img = img.convert("RGBA")
+        img.load()
+    return img
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_payload(
+    image_path: Path,
+    mtime: float,
+    width: int,
+    height: int,
+    pixel_width: int,
+    pixel_height: int,
+) -> str:
+    """Encode an image file to an iTerm2 inline image escape sequence.
+
+    Shared across all ITerm2Image instances so the same image shown in
+    several widgets is only encoded once. ``mtime`` keys both this cache and
+    the decoded source so edited media files are reloaded.
+    """
+    import base64
+    import io
+
+    # Resize the decoded source image. Bilinear is several times cheaper than
+    # Lanczos and indistinguishable at terminal-cell sizes unless the image is
+    # shrunk a lot, where Lanczos' wider filter still avoids aliasing.
+    source = _load_source(image_path, mtime)
+    if pixel_width >= source.width // 2:
+        resample = PILImage.Resampling.BILINEAR
+    else:
+        resample = PILImage.Resampling.LANCZOS
+    img = source.resize((pixel_width, pixel_height), resample)
+
+    # Fully opaque images (most photos) encode as JPEG: much faster than PNG
+    # deflate and a far smaller payload to base64. Keep PNG when alpha matters.
+    buffer = io.BytesIO()
+    if img.getchannel("A").getextrema() == (255, 255):
+        img.convert("RGB").save(buffer, format="JPEG", quality=85)
+    else:
+        img.save(buffer, format="PNG")
+    base64_data = base64.b64encode(buffer.getvalue()).decode("ascii")
+
+    # Build iTerm2 escape sequence
+    args = f"inline=1;width={width};height={height}"
+    return f"\x1b]1337;File={args}:{base64_data}\x07"
+
+
 class _CachedImage(NamedTuple):
-    """Cached iTerm2 image data."""
+    """Cached iTerm2 image data.
+
+    Keyed on the cell block size rather than the full crop region: the
+    encoded payload only depends on the pixel dimensions, so scrolling
+    (which moves the crop offset) must not force a re-encode.
+    """
 
     image_path: Path
-    content_crop: Region
-    content_size: Size
+    mtime: float
+    block_size: Size
     terminal_sizes: _CellSize
     iterm2_data: str
 
     def is_hit(
         self,
         image_path: Path,
-        content_crop: Region,
-        content_size: Size,
+        mtime: float,
+        block_size: Size,
         terminal_sizes: _CellSize,
     ) -> bool:
-        return (
-            image_path == self.image_path
-            and content_crop == self.content_crop
-            and content_size == self.content_size
-            and terminal_sizes == self.terminal_sizes
-        )
+        # One tuple comparison against the key fields (everything but the data)
+        return (image_path, mtime, block_size, terminal_sizes) == self[:4]
 
 
 class ITerm2Image(Widget):
@@ -92,11 +155,13 @@ class ITerm2Image(Widget):
         self._cached: _CachedImage | None = None
         self._image_width = 0
         self._image_height = 0
+        self._mtime = 0.0
         self._load_image_meta()
 
     def _load_image_meta(self) -> None:
-        """Load image dimensions."""
+        """Load image dimensions and modification time."""
         try:
+            self._mtime = self._image_path.stat().st_mtime
             with PILImage.open(self._image_path) as img:
                 self._image_width = img.width
                 self._image_height = img.height
@@ -113,15 +178,16 @@ class ITerm2Image(Widget):
             return []
 
         terminal_sizes = _get_cell_size()
+        block_size = crop.size
 
         if self._cached and self._cached.is_hit(
-            self._image_path, crop, self.content_size, terminal_sizes
+            self._image_path, self._mtime, block_size, terminal_sizes
         ):
             iterm2_data = self._cached.iterm2_data
         else:
             iterm2_data = self._encode_image(crop, terminal_sizes)
             self._cached = _CachedImage(
-                self._image_path, crop, self.content_size, terminal_sizes, iterm2_data
+                self._image_path, self._mtime, block_size, terminal_sizes, iterm2_data
             )
 
         segments = self._get_segments(iterm2_data)
@@ -132,28 +198,14 @@ class ITerm2Image(Widget):
 
     def _encode_image(self, crop: Region, terminal_sizes: _CellSize) -> str:
         """Encode image to iTerm2 format."""
-        import base64
-        import io
-
-        # Calculate pixel dimensions
-        pixel_width = crop.width * terminal_sizes.width
-        pixel_height = crop.height * terminal_sizes.height
-
-        # Load and resize image
-        with PILImage.open(self._image_path) as img:
-            img = img.convert("RGBA")
-            img = img.resize(
-                (pixel_width, pixel_height), PILImage.Resampling.LANCZOS
-            )
-
-            # Encode to PNG base64
-            buffer = io.BytesIO()
-            img.save(buffer, format="PNG")
-            base64_data = base64.b64encode(buffer.getvalue()).decode("ascii")
-
-        # Build iTerm2 escape sequence
-        args = f"inline=1;width={crop.width};height={crop.height}"
-        return f"\x1b]1337;File={args}:{base64_data}\x07"
+        return _encode_payload(
+            self._image_path,
+            self._mtime,
+            crop.width,
+            crop.height,
+            crop.width * terminal_sizes.width,
+            crop.height * terminal_sizes.height,
+        )
 
     def _get_segments(self, iterm2_data: str) -> Iterable[Segment]:
         """Get Rich segments for rendering."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from rich.text import Text
 from textual.widgets import Static
 
 
@@ -20,6 +21,7 @@ class StatsBar(Static):
         super().__init__(id=id)
         self._due = 0
         self._reviewed = 0
+        self._shown: tuple[int, int] | None = None  # Values currently displayed
 
     def update_counts(self, new: int, learn: int, review: int) -> None:
         """Update the deck due counts (calculates total due)."""
@@ -33,9 +35,20 @@ class StatsBar(Static):
 
     def _refresh_display(self) -> None:
         """Refresh the displayed statistics."""
-        text = (
-            f"[dim]Due:[/dim] [bold]{self._due}[/bold]  "
-            f"[dim]Reviewed:[/dim] [bold]{self._reviewed}[/bold]"
+        # Skip the repaint when nothing changed
+        shown = (self._due, self._reviewed)
+        if shown == self._shown:
+            return
+        self._shown = shown
+        # Assemble styled Text directly rather than parsing markup each update
+        text = Text.assemble(
+            ("Due:", "dim"),
+            " ",
+            (str(self._due), "bold"),
+            "  ",
+            ("Reviewed:", "dim"),
+            " ",
+            (str(self._reviewed), "bold"),
         )
         self.update(text)
 
@@ -55,6 +68,7 @@ class DeckCountsBar(Static):
         self._new = 0
         self._learn = 0
         self._review = 0
+        self._shown: tuple[int, int, int] | None = None  # Values currently displayed
 
     def update_counts(self, new: int, learn: int, review: int) -> None:
         """Update the deck due counts."""
@@ -65,10 +79,18 @@ class DeckCountsBar(Static):
 
     def _refresh_display(self) -> None:
         """Refresh the displayed statistics."""
+        # Skip the repaint when nothing changed
+        shown = (self._new, self._learn, self._review)
+        if shown == self._shown:
+            return
+        self._shown = shown
         # Colors matched to Anki's dark mode UI
-        text = (
-            f"[bold #5eb5f7]{self._new}[/bold #5eb5f7] New  "
-            f"[bold #e96c6c]{self._learn}[/bold #e96c6c] Learning  "
-            f"[bold #6cd97e]{self._review}[/bold #6cd97e] Review"
+        text = Text.assemble(
+            (str(self._new), "bold #5eb5f7"),
+            " New  ",
+            (str(self._learn), "bold #e96c6c"),
+            " Learning  ",
+            (str(self._review), "bold #6cd97e"),
+            " Review",
         )
         self.update(text)
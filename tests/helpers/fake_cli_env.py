@@ -18,8 +18,9 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 
 # Fake data classes
@@ -89,8 +90,9 @@ class FakeQueuedCard:
     """Fake QueuedCard protobuf."""
 
     def __init__(self, card_id: int = 1):
-        self.card = MagicMock(id=card_id)
-        self.states = MagicMock()
+        # Plain namespaces: the session only reads card.id and passes states through
+        self.card = SimpleNamespace(id=card_id)
+        self.states = SimpleNamespace()
 
 
 class FakeQueuedCards:
@@ -234,17 +236,20 @@ def create_patches() -> list:
             message="Collection is already in sync.",
         )
 
+    # All clanki.cli replacements go through one patcher
     patches = [
-        patch("clanki.cli.resolve_anki_base", return_value=Path("/fake/anki")),
-        patch("clanki.cli.default_profile", return_value=fake_profile),
-        patch(
-            "clanki.cli.resolve_collection_path",
-            return_value=Path("/fake/anki") / fake_profile / "collection.anki2",
+        patch.multiple(
+            "clanki.cli",
+            resolve_anki_base=Mock(return_value=Path("/fake/anki")),
+            default_profile=Mock(return_value=fake_profile),
+            resolve_collection_path=Mock(
+                return_value=Path("/fake/anki") / fake_profile / "collection.anki2"
+            ),
+            open_collection=Mock(side_effect=create_fake_collection),
+            close_collection=Mock(),
+            _check_tui_available=Mock(return_value=False),
         ),
-        patch("clanki.cli.open_collection", side_effect=create_fake_collection),
-        patch("clanki.cli.close_collection"),
-        patch("clanki.cli.run_sync", return_value=sync_outcome),
-        patch("clanki.cli._check_tui_available", return_value=False),
+        patch("clanki.sync.run_sync", return_value=sync_outcome),
     ]
 
     return patches
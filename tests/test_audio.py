@@ -1,7 +1,16 @@
 """Tests for audio.py - Audio playback support."""
 
+import contextlib
+import io
+import os
+import re
+import shutil
+import sys
+import types
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
+
+import pytest
 
 import clanki.audio as audio_module
 from clanki.audio import (
@@ -20,38 +29,39 @@ from clanki.audio import (
 )
 
 
-def setup_function():
-    """Reset cache before each test."""
+@pytest.fixture(autouse=True)
+def _reset_audio_state():
+    """Reset the cached backend, playback state and thread doubles around each test."""
     reset_audio_cache()
-
-
-def teardown_function():
-    """Reset cache after each test."""
+    _ControlledThread.instances.clear()
+    yield
     reset_audio_cache()
+    _ControlledThread.instances.clear()
 
 
-class _ImmediateThread:
-    """Thread stand-in that executes immediately for deterministic tests."""
-
-    def __init__(self, target, name, daemon):
-        self._target = target
-        self._alive = False
-
-    def start(self):
-        self._alive = True
-        self._target()
-        self._alive = False
+def _immediate_thread(target, name=None, daemon=None):
+    """Thread stand-in that runs its target inline on start() for deterministic tests."""
+    alive = False
 
-    def is_alive(self):
-        return self._alive
+    def start():
+        nonlocal alive
+        alive = True
+        target()
+        alive = False
 
-    def join(self, timeout=None):
-        return None
+    return types.SimpleNamespace(
+        name=name,
+        daemon=daemon,
+        start=start,
+        is_alive=lambda: alive,
+        join=lambda timeout=None: None,
+    )
 
 
 class _ControlledThread:
     """Thread double that allows manual execution of target."""
 
+    # Every instance created during a test; cleared around each test
     instances: list["_ControlledThread"] = []
 
     def __init__(self, target, name, daemon):
@@ -84,6 +94,63 @@ def _which_ffplay_only(cmd: str) -> str | None:
     return None
 
 
+class _FakeProc:
+    """Minimal stand-in for a finished playback process."""
+
+    __slots__ = ("returncode", "stderr")
+
+    def __init__(self, returncode: int = 0, stderr: bytes = b""):
+        self.returncode = returncode
+        self.stderr = io.BytesIO(stderr)
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        pass
+
+    def kill(self):
+        pass
+
+
+@contextlib.contextmanager
+def mock_playback(thread_cls=_immediate_thread, exit_status=0, stderr=b""):
+    """Run playback workers with ``thread_cls`` and stub out process launches.
+
+    Patches are applied with patch.object on the already-imported modules and
+    entered together; yields the Popen mock, whose processes exit with
+    ``exit_status`` after writing ``stderr``.
+    """
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch.object(audio_module.threading, "Thread", thread_cls))
+        mock_popen = stack.enter_context(patch.object(audio_module.subprocess, "Popen"))
+        mock_popen.return_value = _FakeProc(exit_status, stderr)
+        yield mock_popen
+
+
+@pytest.fixture(scope="session")
+def audio_dir(tmp_path_factory):
+    """Media directory with the (empty) audio files the tests refer to.
+
+    Tests only check for existence and names, so one directory is shared by
+    the whole session instead of creating files per test.
+    """
+    media_dir = tmp_path_factory.mktemp("audio")
+    for name in ("test.mp3", "a.mp3", "b.mp3", "sound.mp3", "word.mp3"):
+        (media_dir / name).write_bytes(b"")
+    return media_dir
+
+
+@pytest.fixture
+def ffplay_linux(monkeypatch):
+    """Pretend to run on Linux with only ffplay on PATH."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(shutil, "which", _which_ffplay_only)
+
+
 class TestParseAudioPlaceholders:
     """Tests for parse_audio_placeholders function."""
 
@@ -134,10 +201,30 @@ class TestParseAudioPlaceholders:
         assert len(result) == 1
         assert text[result[0].start : result[0].end] == "[audio: test.mp3]"
 
+    def test_pattern_is_not_recompiled(self, monkeypatch):
+        """Parsing and substitution should reuse the module-level compiled pattern."""
+        assert isinstance(audio_module.AUDIO_PLACEHOLDER_PATTERN, re.Pattern)
+        spy = Mock(wraps=audio_module.AUDIO_PLACEHOLDER_PATTERN)
+        monkeypatch.setattr(audio_module, "AUDIO_PLACEHOLDER_PATTERN", spy)
+        # Module-level re.sub/re.finditer with a string pattern go through re._compile
+        monkeypatch.setattr(re, "_compile", Mock(side_effect=AssertionError("re._compile")))
+
+        for _ in range(10):
+            assert len(parse_audio_placeholders("[audio: 0] [audio: a.mp3]")) == 2
+            substitute_audio_icons("[audio: 0]")
+
+        assert spy.finditer.call_count == 10
+        assert spy.sub.call_count == 10
+
 
 class TestSubstituteAudioIcons:
     """Tests for substitute_audio_icons function."""
 
+    # Expected outputs, built once: audio 1-5 map to keys 5-9, later ones get no key
+    EXPECT_SINGLE = f"Here is {AUDIO_ICON}[5] the sound."
+    EXPECT_MULTIPLE = f"{AUDIO_ICON}[5] and {AUDIO_ICON}[6] and {AUDIO_ICON}[7]"
+    EXPECT_SIX = " ".join(f"{AUDIO_ICON}[{key}]" for key in range(5, 10)) + f" {AUDIO_ICON}"
+
     def test_no_placeholders(self):
         """Text without placeholders should be unchanged."""
         text = "Hello world"
@@ -149,21 +236,21 @@ class TestSubstituteAudioIcons:
         text = "Here is [audio: sound.mp3] the sound."
         result = substitute_audio_icons(text)
         # First audio maps to key 5
-        assert result == f"Here is {AUDIO_ICON}[5] the sound."
+        assert result == self.EXPECT_SINGLE
 
     def test_multiple_placeholders(self):
         """Multiple placeholders should show sequential keys 5-9."""
         text = "[audio: 0] and [audio: 1] and [audio: word.mp3]"
         result = substitute_audio_icons(text)
         # Keys 5, 6, 7 for audio 1, 2, 3
-        assert result == f"{AUDIO_ICON}[5] and {AUDIO_ICON}[6] and {AUDIO_ICON}[7]"
+        assert result == self.EXPECT_MULTIPLE
 
     def test_more_than_five_placeholders(self):
         """Audio beyond 5 should show plain icon (no key binding)."""
         text = "[audio: 1] [audio: 2] [audio: 3] [audio: 4] [audio: 5] [audio: 6]"
         result = substitute_audio_icons(text)
         # First 5 have keys 5-9, 6th has no key
-        assert result == f"{AUDIO_ICON}[5] {AUDIO_ICON}[6] {AUDIO_ICON}[7] {AUDIO_ICON}[8] {AUDIO_ICON}[9] {AUDIO_ICON}"
+        assert result == self.EXPECT_SIX
 
     def test_icon_value(self):
         """AUDIO_ICON should be a speaker emoji."""
@@ -184,47 +271,43 @@ class TestResolveAudioFiles:
             result = resolve_audio_files("Hello", ["sound.mp3"], Path("/media"))
         assert result == []
 
-    def test_index_placeholder_resolves(self, tmp_path):
+    def test_index_placeholder_resolves(self, audio_dir):
         """Index placeholder should resolve to file from audio_files list."""
-        audio_file = tmp_path / "sound.mp3"
-        audio_file.touch()
+        audio_file = audio_dir / "sound.mp3"
 
-        result = resolve_audio_files("[audio: 0]", ["sound.mp3"], tmp_path)
+        result = resolve_audio_files("[audio: 0]", ["sound.mp3"], audio_dir)
         assert len(result) == 1
-        assert result[0] == audio_file
+        assert os.fspath(result[0]) == os.fspath(audio_file)
 
-    def test_index_out_of_range(self, tmp_path):
+    def test_index_out_of_range(self, audio_dir):
         """Out of range index should be skipped."""
-        result = resolve_audio_files("[audio: 5]", ["sound.mp3"], tmp_path)
+        result = resolve_audio_files("[audio: 5]", ["sound.mp3"], audio_dir)
         assert result == []
 
-    def test_filename_placeholder_resolves(self, tmp_path):
+    def test_filename_placeholder_resolves(self, audio_dir):
         """Filename placeholder should resolve directly."""
-        audio_file = tmp_path / "word.mp3"
-        audio_file.touch()
+        audio_file = audio_dir / "word.mp3"
 
-        result = resolve_audio_files("[audio: word.mp3]", [], tmp_path)
+        result = resolve_audio_files("[audio: word.mp3]", [], audio_dir)
         assert len(result) == 1
-        assert result[0] == audio_file
+        assert os.fspath(result[0]) == os.fspath(audio_file)
 
-    def test_missing_file_skipped(self, tmp_path):
+    def test_missing_file_skipped(self, audio_dir):
         """Missing files should be skipped."""
-        result = resolve_audio_files("[audio: missing.mp3]", [], tmp_path)
+        result = resolve_audio_files("[audio: missing.mp3]", [], audio_dir)
         assert result == []
 
-    def test_multiple_files(self, tmp_path):
+    def test_multiple_files(self, audio_dir):
         """Multiple placeholders should resolve to multiple files."""
-        file1 = tmp_path / "a.mp3"
-        file2 = tmp_path / "b.mp3"
-        file1.touch()
-        file2.touch()
+        file1 = audio_dir / "a.mp3"
+        file2 = audio_dir / "b.mp3"
 
         result = resolve_audio_files(
-            "[audio: 0] [audio: b.mp3]", ["a.mp3"], tmp_path
+            "[audio: 0] [audio: b.mp3]", ["a.mp3"], audio_dir
         )
         assert len(result) == 2
-        assert result[0] == file1
-        assert result[1] == file2
+        assert os.fspath(result[0]) == os.fspath(file1)
+        assert os.fspath(result[1]) == os.fspath(file2)
 
 
 class TestAudioBackendAvailability:
@@ -232,8 +315,6 @@ class TestAudioBackendAvailability:
 
     def test_macos_prefers_afplay(self):
         """macOS should prefer afplay when both backends are available."""
-        reset_audio_cache()
-
         def which(cmd):
             if cmd == "afplay":
                 return "/usr/bin/afplay"
@@ -247,34 +328,20 @@ class TestAudioBackendAvailability:
             assert backend.name == "afplay"
             assert is_audio_playback_available() is True
 
-        reset_audio_cache()
-
-    def test_non_macos_uses_ffplay(self):
+    def test_non_macos_uses_ffplay(self, ffplay_linux):
         """Linux/Windows should use ffplay when available."""
-        reset_audio_cache()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-        ):
-            backend = _detect_audio_backend()
-            assert backend is not None
-            assert backend.name == "ffplay"
-            assert is_audio_playback_available() is True
-
-        reset_audio_cache()
+        backend = _detect_audio_backend()
+        assert backend is not None
+        assert backend.name == "ffplay"
+        assert is_audio_playback_available() is True
 
     def test_unavailable_when_no_supported_backend(self):
         """Availability should be false when no supported backend exists."""
-        reset_audio_cache()
-
         with patch("sys.platform", "win32"), patch("shutil.which", return_value=None):
             assert _detect_audio_backend() is None
             assert is_audio_playback_available() is False
             assert "ffplay" in get_audio_unavailable_message()
 
-        reset_audio_cache()
-
 
 class TestPlayAudioFiles:
     """Tests for play_audio_files function."""
@@ -284,41 +351,41 @@ class TestPlayAudioFiles:
         result = play_audio_files([])
         assert result is True
 
-    def test_unavailable_returns_false(self, tmp_path):
-        """Should return False when no supported backend is available."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", return_value=None),
-        ):
+    @pytest.mark.parametrize(
+        ("which", "popen_error", "expected_result", "expected_messages"),
+        [
+            pytest.param(lambda cmd: None, None, False, ["ffplay"], id="no-backend"),
+            pytest.param(
+                _which_ffplay_only,
+                OSError("boom"),
+                True,
+                ["Failed to start audio playback", "ffplay"],
+                id="launch-failure",
+            ),
+        ],
+    )
+    def test_failure_reported_via_on_error(
+        self, audio_dir, monkeypatch, which, popen_error, expected_result, expected_messages
+    ):
+        """A missing backend or a failed launch should be reported once via on_error."""
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setattr(shutil, "which", which)
+
+        with mock_playback() as mock_popen:
+            mock_popen.side_effect = popen_error
             errors = []
-            result = play_audio_files([audio_file], on_error=errors.append)
-            assert result is False
-            assert len(errors) == 1
-            assert "ffplay" in errors[0]
+            result = play_audio_files([audio_dir / "test.mp3"], on_error=errors.append)
 
-        reset_audio_cache()
+        assert result is expected_result
+        assert len(errors) == 1
+        for message in expected_messages:
+            assert message in errors[0]
 
-    def test_plays_existing_files(self, tmp_path):
+    def test_plays_existing_files(self, audio_dir, ffplay_linux):
         """Should play existing files when backend is available."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
+        audio_file = audio_dir / "test.mp3"
 
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 0
-            mock_popen.return_value = mock_proc
+        with mock_playback() as mock_popen:
             result = play_audio_files([audio_file])
             assert result is True
             mock_popen.assert_called_once()
@@ -330,20 +397,11 @@ class TestPlayAudioFiles:
             assert kwargs["stdin"] is audio_module.subprocess.DEVNULL
             assert kwargs["stderr"] is audio_module.subprocess.PIPE
 
-        reset_audio_cache()
-
-    def test_skips_missing_files(self, tmp_path):
+    def test_skips_missing_files(self, audio_dir, ffplay_linux):
         """Should skip files that don't exist."""
-        reset_audio_cache()
-
-        missing_file = tmp_path / "missing.mp3"
+        missing_file = audio_dir / "missing.mp3"
 
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
+        with mock_playback() as mock_popen:
             # File doesn't exist, so subprocess should not be called
             result = play_audio_files([missing_file])
             # Returns True because no error, just nothing to play
@@ -351,38 +409,10 @@ class TestPlayAudioFiles:
             # Verify subprocess was never called for missing file
             mock_popen.assert_not_called()
 
-        reset_audio_cache()
-
-    def test_worker_launch_failure_calls_on_error(self, tmp_path):
-        """Worker launch failures should be reported via on_error."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen", side_effect=OSError("boom")),
-        ):
-            errors = []
-            result = play_audio_files([audio_file], on_error=errors.append)
-            assert result is True
-            assert len(errors) == 1
-            assert "Failed to start audio playback" in errors[0]
-            assert "ffplay" in errors[0]
-
-        reset_audio_cache()
-
-    def test_stop_signal_before_launch_prevents_next_clip(self, tmp_path):
+    def test_stop_signal_before_launch_prevents_next_clip(self, audio_dir, ffplay_linux):
         """Re-check stop signal right before Popen to avoid launching extra clips."""
-        reset_audio_cache()
-
-        file1 = tmp_path / "a.mp3"
-        file2 = tmp_path / "b.mp3"
-        file1.touch()
-        file2.touch()
+        file1 = audio_dir / "a.mp3"
+        file2 = audio_dir / "b.mp3"
         build_count = {"n": 0}
 
         def build_command_and_stop(backend, audio_file):
@@ -393,34 +423,18 @@ class TestPlayAudioFiles:
             return [*backend.base_args, str(audio_file)]
 
         with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
+            mock_playback() as mock_popen,
             patch("clanki.audio._build_play_command", side_effect=build_command_and_stop),
-            patch("subprocess.Popen") as mock_popen,
         ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 0
-            mock_popen.return_value = mock_proc
             assert play_audio_files([file1, file2]) is True
             # Second clip should never launch after stop_event is set.
             assert mock_popen.call_count == 1
 
-        reset_audio_cache()
-
-    def test_stale_worker_cannot_clear_new_playback_state(self, tmp_path):
+    def test_stale_worker_cannot_clear_new_playback_state(self, audio_dir, ffplay_linux):
         """Old worker finalization must not erase newer worker state."""
-        reset_audio_cache()
-        _ControlledThread.instances.clear()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
+        audio_file = audio_dir / "test.mp3"
 
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ControlledThread),
-        ):
+        with mock_playback(_ControlledThread):
             assert play_audio_files([audio_file]) is True
             first_thread = _ControlledThread.instances[-1]
 
@@ -439,70 +453,38 @@ class TestPlayAudioFiles:
             assert audio_module._playback_thread is second_thread
             assert audio_module._playback_stop_event is active_stop_event_before
 
-        reset_audio_cache()
-
-    def test_nonzero_exit_includes_stderr(self, tmp_path):
+    def test_nonzero_exit_includes_stderr(self, audio_dir, ffplay_linux):
         """Non-zero exit should include stderr content in error message."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 1
-            mock_proc.stderr.read.return_value = b"Option nostdin not found."
-            mock_popen.return_value = mock_proc
+        audio_file = audio_dir / "test.mp3"
 
+        with mock_playback(exit_status=1, stderr=b"Option nostdin not found."):
             errors: list[str] = []
             play_audio_files([audio_file], on_error=errors.append)
             assert len(errors) == 1
             assert "status 1" in errors[0]
             assert "Option nostdin not found." in errors[0]
 
-        reset_audio_cache()
-
-    def test_nonzero_exit_empty_stderr(self, tmp_path):
+    def test_nonzero_exit_empty_stderr(self, audio_dir, ffplay_linux):
         """Non-zero exit with empty stderr should give clean message."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 1
-            mock_proc.stderr.read.return_value = b""
-            mock_popen.return_value = mock_proc
+        audio_file = audio_dir / "test.mp3"
 
+        with mock_playback(exit_status=1, stderr=b""):
             errors: list[str] = []
             play_audio_files([audio_file], on_error=errors.append)
             assert len(errors) == 1
             assert "status 1" in errors[0]
             assert errors[0].endswith("(ffplay)")
 
-        reset_audio_cache()
-
 
 class TestPlayAudioForSide:
     """Tests for play_audio_for_side function."""
 
-    def test_no_audio_files(self, tmp_path):
+    def test_no_audio_files(self, audio_dir):
         """Should return True when no audio files to play."""
         result = play_audio_for_side(
             text="Hello",
             audio_files=[],
-            media_dir=tmp_path,
+            media_dir=audio_dir,
         )
         assert result is True
 
@@ -515,32 +497,17 @@ class TestPlayAudioForSide:
         )
         assert result is True
 
-    def test_plays_resolved_files(self, tmp_path):
+    def test_plays_resolved_files(self, audio_dir, ffplay_linux):
         """Should play resolved audio files."""
-        reset_audio_cache()
-
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 0
-            mock_popen.return_value = mock_proc
+        with mock_playback() as mock_popen:
             result = play_audio_for_side(
                 text="[audio: 0]",
                 audio_files=["test.mp3"],
-                media_dir=tmp_path,
+                media_dir=audio_dir,
             )
             assert result is True
             mock_popen.assert_called_once()
 
-        reset_audio_cache()
-
 
 class TestAudioPlaceholderDataclass:
     """Tests for AudioPlaceholder dataclass."""
@@ -567,13 +534,13 @@ class TestAudioPlaceholderDataclass:
 class TestPlayAudioByIndex:
     """Tests for play_audio_by_index function."""
 
-    def test_no_audio_files(self, tmp_path):
+    def test_no_audio_files(self, audio_dir):
         """Should return False when no audio files."""
         errors = []
         result = play_audio_by_index(
             text="Hello",
             audio_files=[],
-            media_dir=tmp_path,
+            media_dir=audio_dir,
             index=1,
             on_error=errors.append,
         )
@@ -581,16 +548,13 @@ class TestPlayAudioByIndex:
         assert len(errors) == 1
         assert "No audio files" in errors[0]
 
-    def test_invalid_index_too_high(self, tmp_path):
+    def test_invalid_index_too_high(self, audio_dir):
         """Should return False for index beyond available files."""
-        audio_file = tmp_path / "test.mp3"
-        audio_file.touch()
-
         errors = []
         result = play_audio_by_index(
             text="[audio: 0]",
             audio_files=["test.mp3"],
-            media_dir=tmp_path,
+            media_dir=audio_dir,
             index=5,  # Only 1 file available
             on_error=errors.append,
         )
@@ -598,28 +562,13 @@ class TestPlayAudioByIndex:
         assert len(errors) == 1
         assert "not found" in errors[0]
 
-    def test_valid_index_plays_file(self, tmp_path):
+    def test_valid_index_plays_file(self, audio_dir, ffplay_linux):
         """Valid index should play the correct file."""
-        reset_audio_cache()
-
-        file1 = tmp_path / "a.mp3"
-        file2 = tmp_path / "b.mp3"
-        file1.touch()
-        file2.touch()
-
-        with (
-            patch("sys.platform", "linux"),
-            patch("shutil.which", side_effect=_which_ffplay_only),
-            patch("clanki.audio.threading.Thread", _ImmediateThread),
-            patch("subprocess.Popen") as mock_popen,
-        ):
-            mock_proc = MagicMock()
-            mock_proc.wait.return_value = 0
-            mock_popen.return_value = mock_proc
+        with mock_playback() as mock_popen:
             result = play_audio_by_index(
                 text="[audio: 0] [audio: 1]",
                 audio_files=["a.mp3", "b.mp3"],
-                media_dir=tmp_path,
+                media_dir=audio_dir,
                 index=2,  # Should play b.mp3
             )
             assert result is True
@@ -628,5 +577,3 @@ class TestPlayAudioByIndex:
             call_args = mock_popen.call_args[0][0]
             assert any("b.mp3" in part for part in call_args)
             assert all("a.mp3" not in part for part in call_args)
-
-        reset_audio_cache()
@@ -0,0 +1,49 @@
+"""Tests for tui/widgets/card_view.py - card image widgets."""
+
+from pathlib import Path
+
+from rich.text import Text
+from textual.widgets import Static
+from textual_image.widget import Image as ImageWidget
+
+import clanki.tui.widgets.card_view as card_view_module
+from clanki.tui.widgets.card_view import CardViewWidget
+
+
+class TestMakeImageWidget:
+    """Tests for CardViewWidget._make_image_widget."""
+
+    def test_unreadable_image_falls_back_to_placeholder_text(self, monkeypatch, tmp_path):
+        """An image whose file can't be stat'ed should not mount an empty image widget."""
+        monkeypatch.setattr(card_view_module, "_is_warp_terminal", lambda: False)
+
+        def fail_stat(self, *args, **kwargs):
+            raise FileNotFoundError(self)
+
+        monkeypatch.setattr(Path, "stat", fail_stat)
+        widget = CardViewWidget()
+        scheduled = []
+        monkeypatch.setattr(widget, "_load_image_in_background", lambda *a: scheduled.append(a))
+
+        result = widget._make_image_widget(tmp_path / "gone.png", 40, 10)
+
+        assert not isinstance(result, ImageWidget)
+        assert isinstance(result, Static)
+        assert result.content == Text("[image: gone.png]")
+        assert scheduled == []
+
+    def test_readable_image_schedules_background_load(self, monkeypatch, tmp_path):
+        """A readable image mounts a placeholder widget that is filled in the background."""
+        from PIL import Image as PILImage
+
+        monkeypatch.setattr(card_view_module, "_is_warp_terminal", lambda: False)
+        path = tmp_path / "pic.png"
+        PILImage.new("RGB", (40, 20)).save(path)
+        widget = CardViewWidget()
+        scheduled = []
+        monkeypatch.setattr(widget, "_load_image_in_background", lambda *a: scheduled.append(a))
+
+        result = widget._make_image_widget(path, 40, 10)
+
+        assert isinstance(result, ImageWidget)
+        assert scheduled == [(result, path, path.stat().st_mtime_ns)]
@@ -44,6 +44,11 @@ class TestConfig:
         assert data["high_contrast"] is True
         assert set(data["expanded_decks"]) == {1, 2, 3}
 
+    def test_to_dict_sorts_expanded_decks(self):
+        """expanded_decks should serialize in a stable order."""
+        data = Config(expanded_decks=frozenset({30, 10, 20})).to_dict()
+        assert data["expanded_decks"] == [10, 20, 30]
+
     def test_from_dict(self):
         """Config should deserialize from dict."""
         data = {
@@ -135,9 +140,6 @@ class TestLoadSaveConfig:
 
     def test_save_and_load_roundtrip(self):
         """Saved config should be loadable."""
-        # Clear cache to force re-read
-        clear_config_cache()
-
         # Save config
         original = Config(images_enabled=False)
         save_config(original)
@@ -155,7 +157,6 @@ class TestLoadSaveConfig:
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text("not valid json {{{")
 
-        clear_config_cache()
         config = load_config()
         assert config.images_enabled is True
 
@@ -165,7 +166,6 @@ class TestLoadSaveConfig:
         config_file.parent.mkdir(parents=True, exist_ok=True)
         config_file.write_text('"just a string"')
 
-        clear_config_cache()
         config = load_config()
         assert config.images_enabled is True
 
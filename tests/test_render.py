@@ -1,5 +1,7 @@
 """Tests for render/html.py - HTML to terminal text conversion."""
 
+import functools
+import re
 from pathlib import Path
 
 from clanki.render.html import (
@@ -12,6 +14,12 @@ from clanki.render.html import (
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@functools.cache
+def read_fixture(name: str) -> str:
+    """Read an HTML fixture, once per test session."""
+    return (FIXTURES_DIR / name).read_text()
+
+
 class TestBasicTags:
     """Tests for basic HTML tag handling."""
 
@@ -37,7 +45,7 @@ class TestBasicTags:
 
     def test_basic_fixture(self):
         """Test rendering of basic.html fixture."""
-        html = (FIXTURES_DIR / "basic.html").read_text()
+        html = read_fixture("basic.html")
         result = render_html_to_text(html)
 
         assert "Hello World" in result
@@ -58,8 +66,7 @@ class TestWhitespaceNormalization:
         """Trailing whitespace from lines should be stripped."""
         result = render_html_to_text("<div>Content   </div>")
         # Lines should not have trailing spaces
-        for line in result.split("\n"):
-            assert not line.endswith(" "), f"Line has trailing space: {repr(line)}"
+        assert re.search(r" (?:\n|\Z)", result) is None, f"Line has trailing space: {result!r}"
         assert "Content" in result
 
     def test_preserves_paragraph_breaks(self):
@@ -88,7 +95,7 @@ class TestSkipTags:
 
     def test_skip_tags_fixture(self):
         """Test skip_tags.html fixture."""
-        html = (FIXTURES_DIR / "skip_tags.html").read_text()
+        html = read_fixture("skip_tags.html")
         result = render_html_to_text(html)
 
         assert "font-size" not in result
@@ -124,9 +131,15 @@ class TestMediaTags:
         result = render_html_to_text('<img src="/path/to/image.png">')
         assert "[image: image.png]" in result
 
+    def test_image_basename_matches_path_name(self):
+        """img basenames should follow the platform's separators, like Path.name."""
+        for src in ("a\\b.png", "dir/sub/", "a/./c.png"):
+            result = render_html_to_text(f'<img src="{src}">')
+            assert f"[image: {Path(src).name}]" in result
+
     def test_media_fixture(self):
         """Test media.html fixture."""
-        html = (FIXTURES_DIR / "media.html").read_text()
+        html = read_fixture("media.html")
         result = render_html_to_text(html)
 
         assert "[audio: 0]" in result
@@ -151,7 +164,7 @@ class TestRubyFurigana:
 
     def test_ruby_fixture(self):
         """Test ruby.html fixture."""
-        html = (FIXTURES_DIR / "ruby.html").read_text()
+        html = read_fixture("ruby.html")
         result = render_html_to_text(html)
 
         assert "漢字(かんじ)" in result
@@ -196,6 +209,23 @@ class TestHtmlEntities:
         assert "Hello" in result
         assert "World" in result
 
+    def test_plain_text_matches_wrapped_text(self):
+        """Tag-free fields should render the same as when wrapped in a div."""
+        text = "  Tea &amp;amp; cake   [sound:bell.mp3]\n\n\nNext"
+        assert render_html_to_text(text) == render_html_to_text(f"<div>{text}</div>")
+
+    def test_plain_text_keeps_trailing_ampersand_word(self):
+        """A bare ampersand near the end of a plain field should not drop text."""
+        assert render_html_to_text("AT&T") == "AT&T"
+
+    def test_styled_segments_keep_trailing_ampersand_word(self):
+        """Styled rendering should keep trailing text after a bare ampersand."""
+        for html in ("AT&T", "<b>AT&T</b>", "text&"):
+            segments = render_html_to_styled_segments(html)
+            expected = html.removeprefix("<b>").removesuffix("</b>")
+            assert "".join([s.text for s in segments]) == expected
+            assert render_html_to_text(html) == expected
+
 
 class TestListFormatting:
     """Tests for list element handling."""
@@ -211,10 +241,14 @@ class TestListFormatting:
         result = render_html_to_text(
             "<ul><li>Outer</li><ul><li>Inner</li></ul></ul>"
         )
-        lines = result.split("\n")
-        # Find the lines with items
-        outer_line = next((l for l in lines if "Outer" in l), "")
-        inner_line = next((l for l in lines if "Inner" in l), "")
+        # Find the lines with items in a single pass
+        outer_line = inner_line = ""
+        for line in result.split("\n"):
+            if "Outer" in line:
+                outer_line = line
+            elif "Inner" in line:
+                inner_line = line
+        assert outer_line
         # Inner should have more leading space
         assert inner_line.startswith("  ") or "  -" in inner_line
 
@@ -233,6 +267,40 @@ class TestEmptyInput:
         assert result == ""
 
 
+class TestRenderCache:
+    """Tests for render_html_to_text memoization."""
+
+    def test_repeated_render_is_cached(self):
+        """Rendering the same HTML twice should reuse the first result."""
+        from clanki.render.html import _render_html_to_text_cached
+
+        html = "<div>Cached <b>card</b></div>"
+        first = render_html_to_text(html, media_dir=Path("/media"))
+        hits_before = _render_html_to_text_cached.cache_info().hits
+        second = render_html_to_text(html, media_dir="/media")
+
+        assert first == second == "Cached card"
+        assert _render_html_to_text_cached.cache_info().hits == hits_before + 1
+
+    def test_styled_segments_are_fresh_copies(self):
+        """Mutating returned styled segments must not leak into the cache."""
+        html = "<b>bold</b> text"
+        first = render_html_to_styled_segments(html)
+        first[0].style.italic = True
+        second = render_html_to_styled_segments(html)
+
+        assert second[0].style.bold
+        assert not second[0].style.italic
+
+    def test_mode_is_part_of_key(self):
+        """Question and answer renders of the same cloze must not collide."""
+        html = '<span class="cloze">secret</span>'
+        question = render_html_to_text(html, mode=RenderMode.QUESTION)
+        answer = render_html_to_text(html, mode=RenderMode.ANSWER)
+
+        assert question != answer
+
+
 class TestClozeDetection:
     """Tests for cloze card detection."""
 
@@ -258,9 +326,22 @@ class TestClozeDetection:
 
     def test_cloze_fixture(self):
         """Test cloze detection with fixture file."""
-        html = (FIXTURES_DIR / "cloze.html").read_text()
+        html = read_fixture("cloze.html")
         assert is_cloze_card(html) is True
 
+    def test_plain_html_skips_pattern_scans(self, monkeypatch):
+        """HTML without any cloze marker should be rejected before a regex scan."""
+        import clanki.render.html as html_module
+
+        class _FailingPattern:
+            def search(self, *args):
+                raise AssertionError("regex scan should have been skipped")
+
+        monkeypatch.setattr(html_module, "CLOZE_PATTERN", _FailingPattern())
+        monkeypatch.setattr(html_module, "_RAW_CLOZE_OPEN_PATTERN", _FailingPattern())
+        is_cloze_card.cache_clear()
+        assert is_cloze_card("<div><span class='hint'>No marker {here}</span></div>") is False
+
 
 class TestClozeRendering:
     """Tests for cloze deletion rendering."""
@@ -299,7 +380,7 @@ class TestClozeRendering:
 
     def test_cloze_fixture_question_mode(self):
         """Test cloze fixture in question mode."""
-        html = (FIXTURES_DIR / "cloze.html").read_text()
+        html = read_fixture("cloze.html")
         result = render_html_to_text(html, mode=RenderMode.QUESTION)
         assert "[...]" in result
         assert "Paris" not in result
@@ -307,7 +388,7 @@ class TestClozeRendering:
 
     def test_cloze_fixture_answer_mode(self):
         """Test cloze fixture in answer mode."""
-        html = (FIXTURES_DIR / "cloze.html").read_text()
+        html = read_fixture("cloze.html")
         result = render_html_to_text(html, mode=RenderMode.ANSWER)
         assert "Paris" in result
         assert "Seine" in result
@@ -327,30 +408,25 @@ class TestStyledSegments:
         """Bold tags should create segments with bold style."""
         html = "<b>bold text</b> normal"
         segments = render_html_to_styled_segments(html)
-        # Find the bold segment
-        bold_segments = [s for s in segments if s.style.bold and "bold" in s.text]
-        assert len(bold_segments) >= 1
+        assert any(s.style.bold and "bold" in s.text for s in segments)
 
     def test_italic_tag_creates_italic_segment(self):
         """Italic tags should create segments with italic style."""
         html = "<i>italic text</i>"
         segments = render_html_to_styled_segments(html)
-        italic_segments = [s for s in segments if s.style.italic]
-        assert len(italic_segments) >= 1
+        assert any(s.style.italic for s in segments)
 
     def test_cloze_answer_mode_creates_cloze_segment(self):
         """Cloze in answer mode should create segment with is_cloze=True."""
         html = '<span class="cloze">answer</span>'
         segments = render_html_to_styled_segments(html, mode=RenderMode.ANSWER)
-        cloze_segments = [s for s in segments if s.style.is_cloze]
-        assert len(cloze_segments) >= 1
-        assert any("answer" in s.text for s in cloze_segments)
+        assert any(s.style.is_cloze and "answer" in s.text for s in segments)
 
     def test_cloze_question_mode_placeholder(self):
         """Cloze in question mode should show [...] placeholder."""
         html = '<span class="cloze">hidden</span>'
         segments = render_html_to_styled_segments(html, mode=RenderMode.QUESTION)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         assert "[...]" in text
         assert "hidden" not in text
 
@@ -358,22 +434,19 @@ class TestStyledSegments:
         """Inline style font-weight:bold should create bold segment."""
         html = '<span style="font-weight: bold;">styled bold</span>'
         segments = render_html_to_styled_segments(html)
-        bold_segments = [s for s in segments if s.style.bold]
-        assert len(bold_segments) >= 1
+        assert any(s.style.bold for s in segments)
 
     def test_inline_style_color(self):
         """Inline style color should be captured."""
         html = '<span style="color: red;">red text</span>'
         segments = render_html_to_styled_segments(html)
-        color_segments = [s for s in segments if s.style.color]
-        assert len(color_segments) >= 1
-        assert any(s.style.color == "red" for s in color_segments)
+        assert any(s.style.color == "red" for s in segments)
 
     def test_spacing_preserved_around_styled_text(self):
         """Spaces should be preserved around styled segments to prevent word concatenation."""
         html = 'word <b>bold</b> next'
         segments = render_html_to_styled_segments(html)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         # Should have spaces between words, not "wordboldnext"
         assert "wordbold" not in text
         assert "boldnext" not in text
@@ -383,7 +456,7 @@ class TestStyledSegments:
         # HTML without spaces around bold tag
         html = 'word<b>bold</b>next'
         segments = render_html_to_styled_segments(html)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         # Should add spaces to prevent "wordboldnext"
         assert "wordbold" not in text
         assert "boldnext" not in text
@@ -395,7 +468,7 @@ class TestStyledSegments:
         """Spaces should be preserved around cloze deletions."""
         html = 'The <span class="cloze">answer</span> is here'
         segments = render_html_to_styled_segments(html, mode=RenderMode.ANSWER)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         # Should be "The answer is here", not "Theansweris here"
         assert "Theanswer" not in text
         assert "answeris" not in text
@@ -404,7 +477,7 @@ class TestStyledSegments:
         """Cloze at start of card should not have leading space."""
         html = '<span class="cloze">Answer</span> is the first word'
         segments = render_html_to_styled_segments(html, mode=RenderMode.ANSWER)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         # Should not start with a space
         assert not text.startswith(" ")
         assert text.startswith("Answer")
@@ -413,7 +486,7 @@ class TestStyledSegments:
         """Spaces should be added around cloze even if missing in original HTML."""
         html = 'word<span class="cloze">cloze</span>next'
         segments = render_html_to_styled_segments(html, mode=RenderMode.ANSWER)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         # Should add spaces to prevent "wordclozenext"
         assert "wordcloze" not in text
         assert "clozenext" not in text
@@ -482,7 +555,7 @@ class TestRawCloze:
         """Raw cloze should be processed in styled segments."""
         html = "Answer: {{c1::42::number}}"
         segments = render_html_to_styled_segments(html, mode=RenderMode.QUESTION)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         assert "[number]" in text
         assert "42" not in text
 
@@ -595,6 +668,6 @@ class TestAnkiTagFiltering:
         """Tags should also be filtered in styled segments output."""
         html = "<div>MileDown::Behavioral</div><div><b>Bold content</b></div>"
         segments = render_html_to_styled_segments(html)
-        text = "".join(s.text for s in segments)
+        text = "".join([s.text for s in segments])
         assert "MileDown" not in text
         assert "Bold content" in text
@@ -54,3 +54,12 @@ def test_review_persist_keeps_high_contrast_and_expanded_decks():
     assert config.high_contrast is True
     assert config.expanded_decks == {123, 456}
 
+
+def test_review_persist_skips_write_when_unchanged(monkeypatch):
+    save_config(Config(high_contrast=True, expanded_decks={123}))
+
+    saved = []
+    monkeypatch.setattr("clanki.tui.screens.review.save_config", saved.append)
+    _persist_config_from_state(_FakeState(high_contrast=True, expanded_decks={123}))
+
+    assert saved == []
@@ -199,6 +199,31 @@ class TestGetCounts:
         assert counts.learn_count == 1
         assert counts.review_count == 4
 
+    def test_get_counts_reuses_recent_tree(self):
+        """Repeated get_counts calls within the TTL should hit the cache."""
+        col = create_mock_collection()
+        session = ReviewSession(col, "Test Deck")
+
+        first = session.get_counts()
+        second = session.get_counts()
+
+        assert first == second
+        col.sched.deck_due_tree.assert_called_once()
+
+    def test_get_counts_refreshes_after_answer(self, mock_anki_scheduler):
+        """Answering a card should invalidate the cached counts."""
+        col = create_mock_collection()
+        col.sched.get_queued_cards.return_value = create_mock_queued_cards()
+        col.get_card.return_value = create_mock_card()
+
+        session = ReviewSession(col, "Test Deck")
+        session.get_counts()
+        session.next_card()
+        session.answer(Rating.GOOD)
+        session.get_counts()
+
+        assert col.sched.deck_due_tree.call_count == 2
+
 
 class TestNextCard:
     """Tests for next_card method."""
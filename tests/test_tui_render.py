@@ -1,10 +1,16 @@
 """Tests for tui/render.py - TUI image placeholder parsing and textual-image rendering."""
 
+import re
 from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
 from rich.text import Text
 
+import clanki.tui.render as tui_render
 from clanki.render import RenderMode, StyledSegment, TextStyle
 from clanki.tui.render import (
+    IMAGE_PLACEHOLDER_PATTERN,
     ImageMarker,
     ImagePlaceholder,
     _create_image_renderable,
@@ -17,6 +23,19 @@ from clanki.tui.render import (
 )
 
 
+@pytest.fixture(scope="session")
+def image_dir(tmp_path_factory):
+    """Media directory with the (empty) image files the tests refer to.
+
+    Rendering only checks that files exist, so one directory is shared by
+    the whole session instead of creating files per test.
+    """
+    media_dir = tmp_path_factory.mktemp("images")
+    for name in ("test.png", "test.jpg"):
+        (media_dir / name).write_bytes(b"")
+    return media_dir
+
+
 class TestParseImagePlaceholders:
     """Tests for parse_image_placeholders function."""
 
@@ -78,6 +97,42 @@ class TestParseImagePlaceholders:
         # Verify the positions by slicing
         assert text[result[0].start : result[0].end] == "[image: test.jpg]"
 
+    def test_text_without_marker_skips_regex(self, monkeypatch):
+        """Text with no [image: marker should never reach the regex."""
+        import clanki.tui.render as render_module
+
+        class _FailingPattern:
+            def __getattr__(self, name):
+                raise AssertionError("regex scan should have been skipped")
+
+        monkeypatch.setattr(render_module, "IMAGE_PLACEHOLDER_PATTERN", _FailingPattern())
+        text = "x [image " * 10_000
+        assert parse_image_placeholders(text) == []
+        assert [str(r) for r in render_content_with_images(text, None, True)] == [text]
+
+    def test_unterminated_whitespace_run_is_linear(self):
+        """A long unterminated blank run after the marker must not backtrack."""
+        # A \s* ahead of the filename class overlaps it and backtracks
+        # quadratically; whitespace is stripped by the caller instead
+        assert r"\s*" not in IMAGE_PLACEHOLDER_PATTERN.pattern
+        assert parse_image_placeholders("[image:" + " " * 20_000 + "x") == []
+        assert parse_image_placeholders("[image:   a.png  ]")[0].filename == "a.png"
+
+    def test_pattern_is_not_recompiled(self, monkeypatch):
+        """Parsing and rendering should reuse the module-level compiled pattern."""
+        assert isinstance(IMAGE_PLACEHOLDER_PATTERN, re.Pattern)
+        spy = Mock(wraps=IMAGE_PLACEHOLDER_PATTERN)
+        monkeypatch.setattr(tui_render, "IMAGE_PLACEHOLDER_PATTERN", spy)
+        # Module-level re.split/re.finditer with a string pattern go through re._compile
+        monkeypatch.setattr(re, "_compile", Mock(side_effect=AssertionError("re._compile")))
+
+        for _ in range(10):
+            assert len(parse_image_placeholders("[image: a.png] [image: b.png]")) == 2
+            render_content_with_images("[image: a.png]", None, images_enabled=True)
+
+        assert spy.finditer.call_count == 10
+        assert spy.split.call_count == 10
+
 
 class TestImageSupportAvailability:
     """Tests for image support availability checking."""
@@ -96,10 +151,9 @@ class TestCreateImageRenderable:
         result = _create_image_renderable(Path("/nonexistent/image.png"))
         assert result is None
 
-    def test_creates_image_marker_when_file_exists(self, tmp_path):
+    def test_creates_image_marker_when_file_exists(self, image_dir):
         """Should create an ImageMarker when file exists."""
-        image_path = tmp_path / "test.png"
-        image_path.touch()
+        image_path = image_dir / "test.png"
 
         result = _create_image_renderable(image_path, max_width=40, max_height=20)
         assert isinstance(result, ImageMarker)
@@ -155,14 +209,12 @@ class TestRenderContentWithImages:
         # Placeholder should be exactly preserved
         assert str(result[0]) == "[image: nonexistent.jpg]"
 
-    def test_existing_file_creates_image_marker(self, tmp_path):
+    def test_existing_file_creates_image_marker(self, image_dir):
         """Existing image file should create ImageMarker."""
-        # Create a test image file
-        image_path = tmp_path / "test.jpg"
-        image_path.touch()
+        image_path = image_dir / "test.jpg"
 
         text = "[image: test.jpg]"
-        result = render_content_with_images(text, tmp_path, images_enabled=True)
+        result = render_content_with_images(text, image_dir, images_enabled=True)
 
         assert len(result) == 1
         assert isinstance(result[0], ImageMarker)
@@ -212,6 +264,24 @@ class TestRenderContentWithImages:
         assert isinstance(result[4], Text)
         assert str(result[4]) == " three"
 
+    def test_repeated_image_checked_once(self, tmp_path, monkeypatch):
+        """An image repeated in one card should only be looked up on disk once."""
+        (tmp_path / "a.jpg").touch()
+        calls = []
+        original = Path.exists
+
+        def counting_exists(self, *args, **kwargs):
+            calls.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", counting_exists)
+        text = "[image: a.jpg] and [image: a.jpg]"
+        result = render_content_with_images(text, tmp_path, images_enabled=True)
+
+        assert [type(r) for r in result] == [ImageMarker, Text, ImageMarker]
+        assert result[0].path == result[2].path == tmp_path / "a.jpg"
+        assert calls.count(tmp_path / "a.jpg") == 1
+
 
 class TestImagePlaceholderDataclass:
     """Tests for ImagePlaceholder dataclass."""
@@ -235,6 +305,10 @@ class TestImagePlaceholderDataclass:
         p2 = ImagePlaceholder(filename="other.jpg", start=10, end=25)
         assert p1 != p2
 
+    def test_has_no_instance_dict(self):
+        """ImagePlaceholder should be slotted (no per-instance __dict__)."""
+        assert not hasattr(ImagePlaceholder(filename="x", start=0, end=0), "__dict__")
+
 
 class TestSegmentToRichStyle:
     """Tests for _segment_to_rich_style function."""